@@ -0,0 +1,112 @@
+import queue
+import threading
+import time
+
+import pygame
+
+import audio_cache
+
+# --- CARREGAMENTO DE SONS EM SEGUNDO PLANO ---
+# O menu aparece na hora; os MP3 são decodificados numa thread separada.
+# play() toca o som se ele já estiver pronto (ou espera até `timeout`
+# segundos) e simplesmente pula se ainda não estiver.
+# Com enabled=False (replays sem tela) nada é carregado nem tocado.
+
+
+class AssetManager:
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.sounds = {}
+        self.ready = {}
+        self.load_times = {}  # ms gastos decodificando cada arquivo
+        self.jobs = queue.Queue()
+        self.thread = None
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.worker, name="assets", daemon=True)
+            self.thread.start()
+
+    def worker(self):
+        while True:
+            job = self.jobs.get()
+            try:
+                job()
+            except Exception as e:
+                # Um arquivo com problema não pode parar os que estão na fila
+                print(f"Aviso: erro carregando som: {e!r}")
+            finally:
+                self.jobs.task_done()
+
+    def load_sound(self, name, path, volume=1.0):
+        self.ready[name] = threading.Event()
+        if not self.enabled:
+            self.ready[name].set()
+            return
+
+        def job():
+            start = time.perf_counter()
+            try:
+                sound = audio_cache.load_sound(path)
+                sound.set_volume(volume)
+                self.sounds[name] = sound
+            except (pygame.error, FileNotFoundError):
+                print(f"Aviso: o arquivo de som {path} não foi encontrado.")
+            finally:
+                self.load_times[name] = (time.perf_counter() - start) * 1000
+                self.ready[name].set()
+
+        self.jobs.put(job)
+        self.start()
+
+    def load_music(self, path, volume, loops=-1):
+        self.ready["music"] = threading.Event()
+        if not self.enabled:
+            self.ready["music"].set()
+            return
+
+        def job():
+            start = time.perf_counter()
+            try:
+                pygame.mixer.music.load(audio_cache.music_path(path))
+                pygame.mixer.music.set_volume(volume)
+                pygame.mixer.music.play(loops)
+            except (pygame.error, FileNotFoundError):
+                print("Nenhuma música encontrada. O jogo rodará sem som.")
+            finally:
+                self.load_times["music"] = (time.perf_counter() - start) * 1000
+                self.ready["music"].set()
+
+        self.jobs.put(job)
+        self.start()
+
+    def load_summary(self):
+        # Ex: "music 40 ms, thunder 120 ms, 2 carregando" (para o log de início)
+        times = dict(self.load_times)
+        parts = [f"{name} {ms:.0f} ms" for name, ms in times.items()]
+        pending = len(self.ready) - len(times)
+        if pending:
+            parts.append(f"{pending} carregando")
+        return ", ".join(parts) or "nenhum"
+
+    def is_ready(self, name):
+        event = self.ready.get(name)
+        return event is not None and event.is_set()
+
+    def get_sound(self, name, timeout=0.0):
+        event = self.ready.get(name)
+        if event is None:
+            return None
+        if timeout > 0:
+            event.wait(timeout)
+        return self.sounds.get(name)
+
+    def play(self, name, timeout=0.0):
+        sound = self.get_sound(name, timeout)
+        if sound is None:
+            return False
+        sound.play()
+        return True
+
+    def wait_all(self):
+        self.jobs.join()
@@ -0,0 +1,141 @@
+import hashlib
+import json
+import mmap
+import os
+import sys
+import wave
+
+import pygame
+
+# --- CACHE DE ÁUDIO DECODIFICADO ---
+# Os MP3 são decodificados uma única vez para PCM na frequência/formato do
+# mixer e salvos em CACHE_DIR. Nas próximas partidas:
+#   - efeitos: o PCM é mapeado em memória (mmap) direto para um Sound
+#   - música: vira um WAV, que o mixer.music continua lendo aos poucos
+# O cache é refeito quando o hash do arquivo original muda.
+#
+#   python audio_cache.py  # gera o cache de todos os sons do jogo
+
+CACHE_DIR = ".audio_cache"
+SOUND_FILES = ["trovao.mp3", "vitoria.mp3", "derrota.mp3"]
+MUSIC_FILES = ["musica.mp3"]
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def mixer_settings():
+    settings = pygame.mixer.get_init()
+    if not settings:
+        raise pygame.error("mixer not initialized")
+    return settings
+
+
+def cache_paths(path, ext):
+    # Um arquivo por configuração do mixer (frequência, formato, canais)
+    frequency, fmt, channels = mixer_settings()
+    stem = os.path.splitext(os.path.basename(path))[0]
+    base = os.path.join(CACHE_DIR, f"{stem}-{frequency}-{fmt}-{channels}")
+    return base + ext, base + ".json"
+
+
+def _is_valid(meta_path, source_hash):
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f).get("sha256") == source_hash
+    except (OSError, ValueError):
+        return False
+
+
+def _write_meta(meta_path, source, source_hash):
+    frequency, fmt, channels = mixer_settings()
+    meta = {"source": source, "sha256": source_hash,
+            "frequency": frequency, "format": fmt, "channels": channels}
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+
+def _write_atomic(path, write):
+    tmp = path + ".tmp"
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def load_sound(path):
+    # Devolve um pygame.mixer.Sound, usando (ou criando) o PCM em cache
+    source_hash = file_hash(path)
+    data_path, meta_path = cache_paths(path, ".pcm")
+
+    # Metadados válidos mas PCM apagado ou vazio: decodifica de novo
+    if (_is_valid(meta_path, source_hash) and os.path.isfile(data_path)
+            and os.path.getsize(data_path) > 0):
+        with open(data_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return pygame.mixer.Sound(buffer=data)
+
+    sound = pygame.mixer.Sound(path)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+
+        def write(tmp):
+            with open(tmp, "wb") as f:
+                f.write(sound.get_raw())
+
+        _write_atomic(data_path, write)
+        _write_meta(meta_path, path, source_hash)
+    except OSError:
+        pass  # Sem permissão de escrita: o jogo roda sem cache
+    return sound
+
+
+def music_path(path):
+    # Devolve o caminho do WAV em cache para o mixer.music (ou o original)
+    frequency, fmt, channels = mixer_settings()
+    if fmt != -16 or sys.byteorder != "little":
+        return path  # WAV guarda PCM de 16 bits com sinal, little-endian
+
+    source_hash = file_hash(path)
+    data_path, meta_path = cache_paths(path, ".wav")
+    if _is_valid(meta_path, source_hash) and os.path.exists(data_path):
+        return data_path
+
+    try:
+        sound = pygame.mixer.Sound(path)
+        raw = sound.get_raw()
+        del sound  # Só os bytes ficam na memória enquanto o WAV é gravado
+        os.makedirs(CACHE_DIR, exist_ok=True)
+
+        def write(tmp):
+            with wave.open(tmp, "wb") as out:
+                out.setnchannels(channels)
+                out.setsampwidth(2)
+                out.setframerate(frequency)
+                out.writeframes(raw)
+
+        _write_atomic(data_path, write)
+        _write_meta(meta_path, path, source_hash)
+        return data_path
+    except (pygame.error, OSError):
+        return path
+
+
+def build_cache():
+    for path in SOUND_FILES:
+        if os.path.exists(path):
+            load_sound(path)
+            print(f"{path}: ok")
+    for path in MUSIC_FILES:
+        if os.path.exists(path):
+            print(f"{path}: {music_path(path)}")
+
+
+if __name__ == "__main__":
+    pygame.mixer.init()
+    if not pygame.mixer.get_init():
+        sys.exit("Mixer indisponível")
+    build_cache()
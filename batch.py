@@ -0,0 +1,200 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from simulation import SIM_DT, Simulation
+
+# --- SIMULAÇÕES EM LOTE (BALANCEAMENTO DE NÍVEIS) ---
+# Roda muitas partidas sem tela, em vários processos, para cada combinação
+# de parâmetros e política de cliques, e salva os resultados em CSV.
+#
+# Exemplo:
+#   python batch.py --grid grade.json --seeds 200 --out resultados.csv
+#
+# grade.json: {"level": [2, 3], "target_time": [7, 9], "energy_total": [50, 70]}
+
+DEFAULT_GRID = {
+    "level": [1, 2, 3],
+}
+DEFAULT_POLICIES = ["greedy:0.25", "greedy:0.5", "random:2"]
+MAX_TIME = 60.0
+
+
+# --- POLÍTICAS DE CLIQUE ---
+# Recebem a simulação a cada passo e decidem se instalam um painel.
+
+class GreedyPolicy:
+    # Clica a cada `interval` segundos no prédio sem painel que mais consome
+    def __init__(self, interval=0.5):
+        self.interval = interval
+        self.next_click = interval
+
+    def __call__(self, sim):
+        if sim.time < self.next_click:
+            return
+        self.next_click += self.interval
+        pending = [b for b in sim.buildings if not b.has_solar]
+        if pending:
+            sim.install(max(pending, key=lambda b: b.consumption))
+
+
+class RandomPolicy:
+    # Em média `rate` cliques por segundo, em prédios aleatórios (podem repetir)
+    def __init__(self, rate=2.0, seed=None):
+        self.rate = rate
+        self.rng = random.Random(seed)
+
+    def __call__(self, sim):
+        if self.rng.random() < self.rate * SIM_DT:
+            sim.install(self.rng.choice(sim.buildings))
+
+
+def make_policy(spec, seed):
+    # "greedy:0.5" -> GreedyPolicy(0.5), "random:2" -> RandomPolicy(2)
+    name, _, arg = spec.partition(":")
+    if name == "greedy":
+        return GreedyPolicy(float(arg or 0.5))
+    if name == "random":
+        # Fluxo próprio: os cliques não repetem os sorteios da simulação
+        return RandomPolicy(float(arg or 2.0), None if seed is None else f"policy:{seed}")
+    raise ValueError(f"Política desconhecida: {spec}")
+
+
+def run_one(job):
+    params, policy_spec, seed = job
+    params = dict(params)
+    level = params.pop("level", 1)
+
+    sim = Simulation(level=level, seed=seed, params=params)
+    policy = make_policy(policy_spec, seed)
+
+    ticks = 0
+    min_energy = sim.energy_total
+    max_ticks = int(MAX_TIME / SIM_DT)
+    while sim.state == "playing" and ticks < max_ticks:
+        policy(sim)
+        sim.step(SIM_DT)
+        ticks += 1
+        if sim.energy_total < min_energy:
+            min_energy = sim.energy_total
+
+    won = sim.state == "victory"
+    return {
+        "level": level,
+        "params": json.dumps(params, sort_keys=True),
+        "policy": policy_spec,
+        "seed": seed,
+        "result": sim.state,
+        "won": int(won),
+        "time_to_win": round(ticks * SIM_DT, 4) if won else "",
+        "min_energy": round(min_energy, 3),
+        "points": round(sim.points, 2),
+        "panels": sim.panels_installed,
+    }
+
+
+def expand_grid(grid):
+    keys = sorted(grid)
+    for values in itertools.product(*(grid[k] for k in keys)):
+        yield dict(zip(keys, values))
+
+
+def make_jobs(grid, policies, seeds):
+    for params in expand_grid(grid):
+        for policy in policies:
+            for seed in range(seeds):
+                yield (params, policy, seed)
+
+
+def run_batch(grid, policies, seeds, workers=None):
+    jobs = list(make_jobs(grid, policies, seeds))
+    workers = workers or os.cpu_count() or 1
+    # Blocos grandes: cada partida é rápida, o custo maior é a comunicação
+    chunksize = max(1, len(jobs) // (workers * 8))
+    if workers == 1:
+        return [run_one(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_one, jobs, chunksize=chunksize))
+
+
+def percentile(values, p):
+    values = sorted(values)
+    if not values:
+        return ""
+    index = min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def summarize(rows):
+    groups = {}
+    for row in rows:
+        groups.setdefault((row["level"], row["params"], row["policy"]), []).append(row)
+
+    summary = []
+    for (level, params, policy), group in sorted(groups.items()):
+        wins = [r for r in group if r["won"]]
+        points = [r["points"] for r in group]
+        summary.append({
+            "level": level,
+            "params": params,
+            "policy": policy,
+            "runs": len(group),
+            "win_rate": round(len(wins) / len(group), 4),
+            "mean_time_to_win": round(statistics.mean(r["time_to_win"] for r in wins), 3) if wins else "",
+            "min_energy": min(r["min_energy"] for r in group),
+            "points_p10": percentile(points, 10),
+            "points_p50": percentile(points, 50),
+            "points_p90": percentile(points, 90),
+        })
+    return summary
+
+
+def write_csv(path, rows):
+    if not rows:
+        return
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulações em lote para balancear os níveis")
+    parser.add_argument("--grid", help="Arquivo JSON com a grade de parâmetros")
+    parser.add_argument("--policy", action="append", help="Política de cliques (greedy:INTERVALO ou random:TAXA)")
+    parser.add_argument("--seeds", type=int, default=100, help="Partidas por combinação")
+    parser.add_argument("--workers", type=int, default=None, help="Processos (padrão: todos os núcleos)")
+    parser.add_argument("--out", default="batch_runs.csv", help="CSV com uma linha por partida")
+    parser.add_argument("--summary", default="batch_summary.csv", help="CSV com o resumo por combinação")
+    args = parser.parse_args()
+
+    grid = DEFAULT_GRID
+    if args.grid:
+        with open(args.grid, encoding="utf-8") as f:
+            grid = json.load(f)
+    policies = args.policy or DEFAULT_POLICIES
+
+    start = time.perf_counter()
+    rows = run_batch(grid, policies, args.seeds, args.workers)
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(rows)
+    write_csv(args.out, rows)
+    write_csv(args.summary, summary)
+
+    print(f"{len(rows)} partidas em {elapsed:.1f}s ({len(rows) / elapsed:.0f} partidas/s)")
+    for row in summary:
+        print(f"Nível {row['level']} {row['params']} {row['policy']}: "
+              f"vitórias {row['win_rate']:.0%}, pontos p50 {row['points_p50']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+# --- BENCHMARK DE RENDERIZAÇÃO ---
+# Roda o Game em cenários fixos (sem janela, driver de vídeo "dummy"),
+# mede o tempo de cada frame e compara com um arquivo de baseline.
+#
+#   python benchmark.py                  # roda e compara com a baseline
+#   python benchmark.py --save-baseline  # grava a baseline desta máquina
+#   python benchmark.py --dirty-rects    # mede o modo de retângulos sujos
+#
+# No modo de retângulos sujos cada cenário aparece como "nome+dirty", com
+# a sua própria linha na baseline.
+
+BASELINE_FILE = "benchmark_baseline.json"
+WARMUP_FRAMES = 30
+FRAMES = 300
+SEED = 1234
+REGRESSION_TOLERANCE = 0.15  # p50 até 15% mais lento ainda passa
+
+
+# --- CENÁRIOS ---
+# setup(game) prepara o estado; tick(game, dt) avança um frame.
+
+def setup_menu(game):
+    game.state = "menu"
+
+
+def setup_tutorial(game):
+    game.state = "tutorial"
+
+
+def setup_level3_panels(game):
+    game.level = 3
+    game.reset_level()
+    game.state = "playing"
+    for building in game.buildings:
+        game.install(building)
+        building.install_animation = 0
+
+
+def setup_storm(game):
+    game.level = 3
+    game.reset_level()
+    game.state = "playing"
+    game.time = game.target_time
+    game.step()
+    # Chuva já caindo desde o início da medição
+    for _ in range(120):
+        game.update_effects(1 / 60)
+
+
+def setup_victory(game):
+    game.level = 3
+    game.reset_level()
+    game.state = "playing"
+    for building in game.buildings:
+        game.install(building)
+    game.step()
+
+
+def setup_city(size):
+    # Cidade gerada com a câmera rolando: o tempo por frame não deve crescer com `size`
+    def setup(game):
+        game.params = {"city_size": size}
+        game.reset_level()
+        game.state = "playing"
+        for building in game.buildings[::3]:
+            game.install(building)
+            building.install_animation = 0
+        game.scroll_dir = 1
+    return setup
+
+
+def tick_effects(game, dt):
+    # Só efeitos visuais: o estado da partida fica congelado no cenário
+    game.update_effects(dt)
+
+
+def tick_storm(game, dt):
+    game.update_effects(dt)
+    game.game_over_delay_timer = 0
+
+
+SCENARIOS = {
+    "menu": (setup_menu, tick_effects),
+    "tutorial": (setup_tutorial, tick_effects),
+    "level3_panels": (setup_level3_panels, tick_effects),
+    "storm": (setup_storm, tick_storm),
+    "victory": (setup_victory, tick_effects),
+    "city_200": (setup_city(200), tick_effects),
+    "city_5000": (setup_city(5000), tick_effects),
+}
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))]
+
+
+def run_scenario(main, screen, name, frames=FRAMES, seed=SEED, dirty_rects=False):
+    import pygame
+    setup, tick = SCENARIOS[name]
+    # Sem sons: nenhuma thread decodificando MP3 enquanto os frames são medidos
+    game = main.Game(main.AssetManager(enabled=False), seed=seed)
+    setup(game)
+
+    if dirty_rects:
+        # Igual ao laço do jogo: buffer persistente, só as áreas alteradas vão para a tela
+        back_buffer = pygame.Surface(screen.get_size()).convert()
+
+        def draw():
+            rects = game.draw_dirty(back_buffer)
+            for rect in rects:
+                screen.blit(back_buffer, rect, rect)
+            pygame.display.update(rects)
+    else:
+        def draw():
+            game.draw(screen)
+            pygame.display.flip()
+
+    dt = main.SIM_DT
+    for _ in range(WARMUP_FRAMES):
+        tick(game, dt)
+        draw()
+
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        tick(game, dt)
+        draw()
+        times.append((time.perf_counter() - start) * 1000)
+
+    mean = sum(times) / len(times)
+    return {
+        "fps": round(1000 / mean, 1),
+        "mean_ms": round(mean, 3),
+        "p50_ms": round(percentile(times, 0.50), 3),
+        "p95_ms": round(percentile(times, 0.95), 3),
+        "p99_ms": round(percentile(times, 0.99), 3),
+        "max_ms": round(max(times), 3),
+    }
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        ratio = result["p50_ms"] / base["p50_ms"] if base["p50_ms"] else 1.0
+        status = "REGRESSÃO" if ratio > 1 + tolerance else "ok"
+        print(f"  {name:<20} p50 {base['p50_ms']:7.3f} -> {result['p50_ms']:7.3f} ms ({ratio - 1:+.0%}) {status}")
+        if status != "ok":
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de renderização em cenários fixos")
+    parser.add_argument("scenarios", nargs="*", help=f"Cenários ({', '.join(SCENARIOS)}); padrão: todos")
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true", help="Grava os resultados como nova baseline")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE)
+    parser.add_argument("--window", action="store_true", help="Usa uma janela de verdade em vez do driver dummy")
+    parser.add_argument("--dirty-rects", action="store_true", help="Desenha pelo modo de retângulos sujos")
+    args = parser.parse_args()
+
+    if not args.window:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+    import main as game_main
+    screen = game_main.init_display()
+
+    names = args.scenarios or list(SCENARIOS)
+    results = {}
+    for name in names:
+        r = run_scenario(game_main, screen, name, args.frames, args.seed, args.dirty_rects)
+        if args.dirty_rects:
+            name += "+dirty"
+        results[name] = r
+        print(f"{name:<20} {r['fps']:8.1f} fps  p50 {r['p50_ms']:.3f}  p95 {r['p95_ms']:.3f}  p99 {r['p99_ms']:.3f} ms")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline salva em {args.baseline}")
+        return 0
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"Comparando com {args.baseline}:")
+        if compare(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# --- CÉU DE NUVENS EM CAMADAS ---
+# Cada nuvem é um sprite pronto por (faixa de tamanho, tempestade): os três
+# círculos e a elipse são desenhados uma vez só. Posições e velocidades de
+# todas as camadas ficam em arrays, atualizados de uma vez, e o desenho é um
+# único Surface.blits. As camadas mais distantes andam mais devagar e se
+# deslocam menos com a câmera (paralaxe).
+
+CLOUD_SIZE_STEP = 10   # Tamanhos arredondados para faixas (um sprite por faixa)
+CLOUD_MARGIN = 250     # Nuvens dão a volta fora da tela, sem aparecer de repente
+CLOUD_COLOR = (255, 255, 255)
+CLOUD_STORM = (160, 160, 180)
+HAZE_COLOR = (135, 206, 235)   # Céu: as camadas distantes se misturam a ele
+HAZE_STORM = (70, 80, 100)
+
+# Camadas, da mais distante para a mais próxima:
+# (nuvens, tamanho, altura, velocidade, paralaxe em relação à câmera, névoa 0-1)
+CLOUD_LAYERS = [
+    (5, (70, 120), (50, 150), (0.5, 1.5), 0.3, 0.0),
+]
+# Cidade grande (rolagem da câmera): céu mais cheio
+CITY_CLOUD_LAYERS = [
+    (12, (30, 50), (30, 90), (0.15, 0.35), 0.1, 0.5),
+    (8, (50, 80), (60, 140), (0.3, 0.8), 0.2, 0.25),
+    (5, (70, 120), (50, 150), (0.5, 1.5), 0.3, 0.0),
+]
+
+_KEY = (255, 0, 255)  # Cor de fundo transparente dos sprites
+_sprites = {}
+
+
+def get_cloud_sprite(size, storm, haze=0.0):
+    key = (size, storm, haze)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        # Mesmo desenho da nuvem antiga, com a origem em (x - size - 1, y - size - 1)
+        color, sky = (CLOUD_STORM, HAZE_STORM) if storm else (CLOUD_COLOR, HAZE_COLOR)
+        color = tuple(int(c + (s - c) * haze) for c, s in zip(color, sky))
+        # Formas sem antialiasing: cor-chave (RLE) em vez de alpha por pixel,
+        # bem mais rápido de copiar
+        sprite = pygame.Surface((size*3 + 3, size*2 + 3))
+        sprite.fill(_KEY)
+        sprite.set_colorkey(_KEY, pygame.RLEACCEL)
+        x = y = size + 1
+        pygame.draw.circle(sprite, color, (x, y), size)
+        pygame.draw.circle(sprite, color, (x + int(size*0.7), y), int(size*0.8))
+        pygame.draw.circle(sprite, color, (x + int(size*1.3), y), int(size*0.7))
+        pygame.draw.ellipse(sprite, color, (x - size, y - size//2, size*3, size*1.2))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+        _sprites[key] = sprite
+    return sprite
+
+
+def _generate(rng, width, layers):
+    # (x, y, velocidade, tamanho, paralaxe, névoa) de cada nuvem, camada por camada
+    clouds = []
+    for count, size, height, speed, parallax, haze in layers:
+        for _ in range(count):
+            x = rng.randint(0, width)
+            y = rng.randint(*height)
+            s = rng.uniform(*speed)
+            r = rng.randint(*size)
+            r = max(CLOUD_SIZE_STEP, round(r / CLOUD_SIZE_STEP) * CLOUD_SIZE_STEP)
+            clouds.append((x, y, s, r, parallax, haze))
+    return clouds
+
+
+class CloudField:
+    def __init__(self, width, rng, layers=CLOUD_LAYERS):
+        self.width = width
+        self.span = width + CLOUD_MARGIN * 2
+        clouds = _generate(rng, width, layers)
+        self.x = numpy.array([c[0] for c in clouds], dtype=numpy.float64)
+        self.prev_x = self.x.copy()  # Posição no passo anterior
+        self.y = numpy.array([c[1] for c in clouds], dtype=numpy.int32)
+        self.speed = numpy.array([c[2] for c in clouds], dtype=numpy.float64)
+        self.size = numpy.array([c[3] for c in clouds], dtype=numpy.int32)
+        self.parallax = numpy.array([c[4] for c in clouds], dtype=numpy.float64)
+        self.sizes = self.size.tolist()
+        self.hazes = [c[5] for c in clouds]
+        self.drawn = None  # Posições na tela do último desenho (modo de retângulos sujos)
+
+    def __len__(self):
+        return len(self.x)
+
+    def update(self, dt):
+        self.prev_x[:] = self.x
+        self.x += self.speed * (dt * 30)
+        # Volta ao início: as duas posições andam juntas, sem interpolar o salto
+        wrapped = self.x >= self.span
+        self.x[wrapped] -= self.span
+        self.prev_x[wrapped] -= self.span
+
+    def positions(self, alpha=1.0, camera_x=0):
+        # Canto de cada sprite na tela: [(x, y)]
+        x = self.prev_x + (self.x - self.prev_x) * alpha - camera_x * self.parallax
+        x = (x + CLOUD_MARGIN) % self.span - CLOUD_MARGIN
+        xs = x.astype(numpy.int32) - self.size - 1
+        ys = self.y - self.size - 1
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def rects(self, alpha=1.0, camera_x=0):
+        return [pygame.Rect(x, y, size*3 + 3, size*2 + 3)
+                for (x, y), size in zip(self.positions(alpha, camera_x), self.sizes)]
+
+    def dirty_rects(self, alpha=1.0, camera_x=0):
+        # Área antiga + nova das nuvens que mudaram de pixel desde o último desenho
+        positions = self.positions(alpha, camera_x)
+        if self.drawn is None:
+            return self.rects(alpha, camera_x)
+        rects = []
+        for new, old, size in zip(positions, self.drawn, self.sizes):
+            if new != old:
+                w, h = size*3 + 3, size*2 + 3
+                rects.append(pygame.Rect(new, (w, h)).union(pygame.Rect(old, (w, h))))
+        return rects
+
+    def draw(self, surface, storm=False, alpha=1.0, camera_x=0):
+        self.drawn = positions = self.positions(alpha, camera_x)
+        surface.blits([(get_cloud_sprite(size, storm, haze), pos)
+                       for size, haze, pos in zip(self.sizes, self.hazes, positions)], doreturn=False)
+
+
+class _ListCloudField(CloudField):
+    # Versão sem NumPy: mesma interface, listas de floats
+    def __init__(self, width, rng, layers=CLOUD_LAYERS):
+        self.width = width
+        self.span = width + CLOUD_MARGIN * 2
+        clouds = _generate(rng, width, layers)
+        self.x = [float(c[0]) for c in clouds]
+        self.prev_x = list(self.x)
+        self.y = [c[1] for c in clouds]
+        self.speed = [c[2] for c in clouds]
+        self.sizes = [c[3] for c in clouds]
+        self.parallax = [c[4] for c in clouds]
+        self.hazes = [c[5] for c in clouds]
+        self.drawn = None
+
+    def update(self, dt):
+        self.prev_x = list(self.x)
+        step = dt * 30
+        for i, speed in enumerate(self.speed):
+            x = self.x[i] + speed * step
+            if x >= self.span:
+                x -= self.span
+                self.prev_x[i] -= self.span
+            self.x[i] = x
+
+    def positions(self, alpha=1.0, camera_x=0):
+        return [(int((prev + (x - prev) * alpha - camera_x * p + CLOUD_MARGIN) % self.span - CLOUD_MARGIN) - size - 1,
+                 y - size - 1)
+                for x, prev, y, size, p in zip(self.x, self.prev_x, self.y, self.sizes, self.parallax)]
+
+
+if numpy is None:
+    CloudField = _ListCloudField
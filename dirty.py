@@ -0,0 +1,59 @@
+import pygame
+
+# Se a área suja passar dessa fração da tela, vale mais redesenhar tudo
+FULL_REDRAW_RATIO = 0.5
+MAX_RECTS = 12
+# Acima disso, desenha uma vez só no retângulo que cobre todas as áreas
+MAX_CLIP_PASSES = 2
+
+
+class DirtyTracker:
+    # Junta as áreas que mudaram no frame e decide entre
+    # redesenho parcial (lista de retângulos) ou redesenho completo.
+    def __init__(self, width, height):
+        self.screen_rect = pygame.Rect(0, 0, width, height)
+        self.rects = []
+        self.full = True
+
+    def resize(self, width, height):
+        self.screen_rect = pygame.Rect(0, 0, width, height)
+        self.mark_all()
+
+    def mark(self, rect):
+        if rect is None:
+            return
+        rect = self.screen_rect.clip(rect)
+        if rect.width > 0 and rect.height > 0:
+            self.rects.append(rect)
+
+    def mark_all(self):
+        self.full = True
+
+    def collect(self):
+        if self.full:
+            rects = [self.screen_rect.copy()]
+        else:
+            rects = merge_rects(self.rects)
+            area = sum(r.width * r.height for r in rects)
+            if len(rects) > MAX_RECTS or area > self.screen_rect.width * self.screen_rect.height * FULL_REDRAW_RATIO:
+                rects = [self.screen_rect.copy()]
+
+        self.rects = []
+        self.full = False
+        return rects
+
+
+def merge_rects(rects):
+    # Une retângulos que se sobrepõem até não sobrar nenhuma sobreposição
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        i = 0
+        while i < len(merged):
+            if merged[i].colliderect(rect):
+                rect.union_ip(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
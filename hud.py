@@ -0,0 +1,108 @@
+import pygame
+
+from render_cache import TextLabel, render_text
+
+# --- HUD RETIDO ---
+# O painel, o fundo da barra e a borda são desenhados uma única vez. A barra
+# de energia tem um gradiente pronto para cada faixa de cor e é recortada
+# pela porcentagem com um único blit. Os textos só são renderizados de novo
+# quando o valor exibido muda.
+
+HUD_RECT = pygame.Rect(20, 20, 380, 320)
+BAR_RECT = pygame.Rect(40, 40, 340, 40)  # Posição na tela
+INFO_Y = 100
+INFO_SPACING = 40
+ALERT_SIZE = (300, 60)
+
+# Faixas de cor da barra: (acima de, cor inicial, cor final)
+ENERGY_BANDS = [
+    (0.5, (76, 175, 80), (129, 199, 132)),
+    (0.25, (255, 167, 38), (255, 202, 40)),
+    (-1.0, (244, 67, 54), (239, 83, 80)),
+]
+
+
+def _build_bar(color1, color2):
+    width, height = BAR_RECT.size
+    bar = pygame.Surface((width, height))
+    for i in range(width):
+        factor = i / width
+        color = tuple(int(color1[j] + (color2[j] - color1[j]) * factor) for j in range(3))
+        bar.fill(color, (i, 0, 1, height))
+    return bar
+
+
+class Hud:
+    def __init__(self, screen_width):
+        self.screen_width = screen_width
+        self.energy_label = TextLabel(32, (50, 50, 50))
+        self.info_labels = [
+            TextLabel(26, (30, 144, 255)),   # Nível
+            TextLabel(26, (100, 100, 100)),  # Tempo
+            TextLabel(26, (255, 152, 0)),    # Painéis
+            TextLabel(26, (156, 39, 176)),   # Pontos
+            TextLabel(26, (76, 175, 80)),    # CO2
+        ]
+        self.panel = None
+        self.border = None
+        self.bars = None
+        self.alert = None
+        self.key = None
+
+    def build(self):
+        # Painel translúcido com o fundo cinza da barra já aplicado
+        self.panel = pygame.Surface(HUD_RECT.size, pygame.SRCALPHA)
+        pygame.draw.rect(self.panel, (255, 255, 255, 230), (0, 0, *HUD_RECT.size), border_radius=20)
+        pygame.draw.rect(self.panel, (200, 200, 200), BAR_RECT.move(-HUD_RECT.x, -HUD_RECT.y), border_radius=20)
+
+        self.border = pygame.Surface(BAR_RECT.size, pygame.SRCALPHA)
+        pygame.draw.rect(self.border, (100, 100, 100), (0, 0, *BAR_RECT.size), 3, border_radius=20)
+
+        self.bars = [(threshold, _build_bar(color1, color2)) for threshold, color1, color2 in ENERGY_BANDS]
+
+        self.alert = pygame.Surface(ALERT_SIZE, pygame.SRCALPHA)
+        pygame.draw.rect(self.alert, (255, 235, 59, 240), (0, 0, *ALERT_SIZE), border_radius=15)
+
+    def values(self, game):
+        energy_percent = max(0, min(1, game.energy_total / game.energy_max))
+        texts = (
+            f"Energia: {int(game.energy_total)}",
+            f"Nível: {game.level}",
+            f"Tempo: {int(min(game.time, game.target_time))}s / {game.target_time}s",
+            f"Painéis: {game.panels_installed}",
+            f"Pontos: {int(game.points)}",
+            f"CO2: {int(game.co2_avoided)} kg",
+        )
+        return energy_percent, texts
+
+    def changed(self, game):
+        # Para o modo de retângulos sujos: o HUD só precisa ser redesenhado
+        # quando algo visível nele muda
+        energy_percent, texts = self.values(game)
+        key = (int(BAR_RECT.width * energy_percent), energy_percent > 0.5, energy_percent > 0.25, texts)
+        if key == self.key:
+            return False
+        self.key = key
+        return True
+
+    def draw(self, surface, game):
+        if self.panel is None:
+            self.build()
+        energy_percent, texts = self.values(game)
+
+        surface.blit(self.panel, HUD_RECT.topleft)
+
+        energy_width = int(BAR_RECT.width * energy_percent)
+        bar = next(bar for threshold, bar in self.bars if energy_percent > threshold)
+        surface.blit(bar, BAR_RECT.topleft, (0, 0, energy_width, BAR_RECT.height))
+        surface.blit(self.border, BAR_RECT.topleft)
+
+        surface.blit(self.energy_label.render(texts[0]), (BAR_RECT.x + 10, BAR_RECT.y + 8))
+        for i, (text, label) in enumerate(zip(texts[1:], self.info_labels)):
+            surface.blit(label.render(text), (40, INFO_Y + i * INFO_SPACING))
+
+        if game.storm_active:
+            alert_x = self.screen_width // 2 - ALERT_SIZE[0] // 2
+            surface.blit(self.alert, (alert_x, 20))
+            storm_text = render_text("TEMPESTADE!", 32, (198, 40, 40))
+            surface.blit(storm_text, (self.screen_width // 2 - storm_text.get_width() // 2, 35))
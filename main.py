@@ -1,18 +1,70 @@
+import time
+STARTUP_TIME = time.perf_counter()  # Início do processo, para medir o tempo até o primeiro frame
+
+import argparse
 import pygame
 import random
 import math
 
-# Inicialização
-pygame.init()
-pygame.mixer.init()
+from assets import AssetManager
+from clouds import CITY_CLOUD_LAYERS, CLOUD_LAYERS, CloudField
+from dirty import MAX_CLIP_PASSES, DirtyTracker, merge_rects
+from hud import HUD_RECT, Hud
+from pacing import ACTIVE, AMBIENT, STATIC, FramePacer
+from particles import ParticlePool
+from profiler import profiler
+from rain import RainSystem
+from replay import CLICK, WHEEL, Recorder, Replay, run_frame
+from render_cache import LayerCache, get_gradient, render_text
+from storm import StormEffects
+from ui import Button, UIRegistry, plain_button
+from viewport import Viewport
+from simulation import SIM_DT, SOLAR_RANGE, BuildingState, Simulation
 
 # Configurações de Tela
+# Tamanho da tela lógica: todas as coordenadas do jogo. A janela pode ter
+# outro tamanho (--window, --fullscreen) e recebe a tela escalada (viewport.py)
 WIDTH, HEIGHT = 1200, 800
-FPS = 60
+FPS = 60  # Limite de frames desenhados por segundo (0 = sem limite)
+
+# Laço principal: a simulação anda em passos fixos de SIM_DT; o desenho
+# acontece na taxa de FPS e interpola entre o passo anterior e o atual.
+# Telas paradas ou sem ninguém mexendo desenham menos (pacing.py).
+MAX_SUBSTEPS = 5     # Passos de simulação por frame, no máximo
+MAX_FRAME_SKIP = 2   # Frames seguidos sem desenhar para alcançar a simulação
+
+# Partículas
+INSTALL_BURST_PARTICLES = 15  # Partículas por painel instalado
+
+# Chuva (tempestade)
+RAIN_SPAWN_RATE = 48   # Gotas por segundo
+RAIN_MAX_DROPS = 600   # Limite de gotas na tela ao mesmo tempo
+
+# Cidade gerada: quantidade de prédios (0 = níveis normais).
+# Setas ou roda do mouse movem a câmera.
+CITY_SIZE = 0
+CAMERA_SPEED = 900       # Pixels por segundo com a seta pressionada
+CAMERA_WHEEL_STEP = 120  # Pixels por clique da roda do mouse
+CULL_MARGIN = 200        # Prédios até essa distância fora da tela ainda são desenhados
+
+# Efeitos visuais (sorteados uma vez, sem random por frame)
+GRASS_Y = HEIGHT - 150
+CONFETTI_COUNT = 40
+CONFETTI_SETS = 8   # Conjuntos de confetes pré-sorteados, alternados na vitória
+CONFETTI_RATE = 30  # Trocas de conjunto por segundo
+CONFETTI_COLORS = [(255, 255, 0), (255, 100, 100), (100, 255, 100), (100, 200, 255)]
+VICTORY_PANEL_H = 680  # Painel da vitória (os botões ficam no rodapé dele)
+
+# Modo de retângulos sujos: redesenha e apresenta só as áreas que mudaram
+DIRTY_RECT_MODE = False
+
+# Profiler: F3 mostra/esconde o overlay, F4 salva o trace dos frames
+PROFILE_TRACE_FILE = "frame_trace.json"
 
 # Configurações de Volume
 MUSIC_VOL_NORMAL = 0.1  # Volume ambiente
 MUSIC_VOL_LOW = 0.02    # Volume baixo durante efeitos
+SFX_WAIT = 0.05         # Segundos que um efeito pode esperar pelo carregamento
 
 # Cores
 SKY_BLUE = (135, 206, 235)
@@ -22,11 +74,6 @@ GRASS_GREEN = (76, 175, 80)
 DARK_GREEN = (56, 142, 60)
 RAIN_COLOR = (180, 180, 200)
 
-BUILDING_COLORS = [
-    (255, 107, 107), (255, 159, 64), (255, 206, 86), (75, 192, 192),
-    (54, 162, 235), (153, 102, 255), (255, 99, 132), (100, 221, 23),
-]
-
 PANEL_BLUE = (30, 144, 255)
 PANEL_DARK = (25, 118, 210)
 WHITE = (255, 255, 255)
@@ -34,70 +81,93 @@ BLACK = (0, 0, 0)
 SHADOW = (0, 0, 0, 60)
 BTN_MENU_COLOR = (120, 144, 156)
 
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Cidade Solar Inteligente")
 clock = pygame.time.Clock()
 
-class Particle:
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.size = random.randint(3, 8)
-        self.vx = random.uniform(-2, 2)
-        self.vy = random.uniform(-4, -1)
-        self.life = 1.0
-
-    def update(self, dt):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.2
-        self.life -= dt * 2
-
-    def draw(self, surface):
-        if self.life > 0:
-            alpha = int(255 * self.life)
-            size = int(self.size * self.life)
-            s = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            pygame.draw.circle(s, (*self.color, alpha), (size, size), size)
-            surface.blit(s, (int(self.x - size), int(self.y - size)))
-
-class Building:
+class Building(BuildingState):
     def __init__(self, x, y, width, height, name, consumption, color):
-        self.rect = pygame.Rect(x, y, width, height)
-        self.name = name
-        self.consumption = consumption
-        self.color = color
-        self.has_solar = False
-        self.solar_generation = 0
+        super().__init__(x, y, width, height, name, consumption, color)
         self.hover = False
         self.install_animation = 0
-
-    def install_solar(self):
-        if not self.has_solar:
-            self.has_solar = True
-            # Geração ajustada (Média de 23 por painel)
-            self.solar_generation = 22 + random.randint(-2, 5)
-            self.install_animation = 1.0
+        self.prev_animation = 0  # Valor no passo anterior, para interpolar
+
+        # Janelas acesas/apagadas fixas por prédio (não mudam a cada frame)
+        window_rng = random.Random(f"{name}:{x}:{y}")
+        self.window_lit = [window_rng.random() > 0.3 for _ in range(15)]
+
+        # --- SPRITE PRÉ-RENDERIZADO ---
+        self.sprite = None
+        self.sprite_key = None
+        self.sprite_offset = (0, 0)
+        self.hover_surf = None
+        self.drawn_state = None
+
+    def install_solar(self, rng=random, solar_range=SOLAR_RANGE):
+        if super().install_solar(rng, solar_range):
+            self.install_animation = self.prev_animation = 1.0
             return True
         return False
 
     def update(self, dt):
+        self.prev_animation = self.install_animation
         if self.install_animation > 0:
             self.install_animation -= dt * 2
 
-    def draw(self, surface):
-        shadow_surf = pygame.Surface((self.rect.width + 10, self.rect.height + 10), pygame.SRCALPHA)
-        pygame.draw.rect(shadow_surf, SHADOW, (0, 0, self.rect.width + 10, self.rect.height + 10), border_radius=8)
-        surface.blit(shadow_surf, (self.rect.x + 5, self.rect.y + 5))
+    def panel_rect(self):
+        return pygame.Rect(self.rect.x + 5, self.rect.y - 25, self.rect.width - 10, 22)
+
+    @staticmethod
+    def panel_area(panel_rect):
+        # Painel mais a sombra dele (deslocada 2px e 4px maior)
+        return panel_rect.union(pygame.Rect(panel_rect.x + 2, panel_rect.y + 2, panel_rect.width + 4, panel_rect.height + 4))
+
+    def animated_panel_rect(self, animation):
+        # Painel crescendo na animação de instalação (animation de 0 a 1)
+        panel_rect = self.panel_rect()
+        scale = 1 + animation * 0.3
+        panel_rect.inflate_ip(int((scale - 1) * panel_rect.width), int((scale - 1) * panel_rect.height))
+        return panel_rect
 
+    def draw_panel(self, surface, panel_rect):
+        shadow_panel = pygame.Surface((panel_rect.width + 4, panel_rect.height + 4), pygame.SRCALPHA)
+        pygame.draw.rect(shadow_panel, SHADOW, (0, 0, panel_rect.width + 4, panel_rect.height + 4), border_radius=4)
+        surface.blit(shadow_panel, (panel_rect.x + 2, panel_rect.y + 2))
+
+        pygame.draw.rect(surface, PANEL_DARK, panel_rect, border_radius=4)
+
+        cell_w = (panel_rect.width - 8) // 5
+        highlight = pygame.Surface((max(1, cell_w - 2), 4), pygame.SRCALPHA)
+        highlight.fill((255, 255, 255, 100))
+        for i in range(5):
+            cell_x = panel_rect.x + 4 + i * cell_w
+            cell_rect = pygame.Rect(cell_x, panel_rect.y + 3, cell_w - 2, panel_rect.height - 6)
+            pygame.draw.rect(surface, PANEL_BLUE, cell_rect, border_radius=2)
+            surface.blit(highlight, (cell_x, panel_rect.y + 3))
+
+        pygame.draw.rect(surface, PANEL_DARK, panel_rect, 2, border_radius=4)
+
+    def bake(self, with_panel):
+        text = render_text(self.name, 24, WHITE)
+        label_rect = pygame.Rect(self.rect.centerx - text.get_width()//2 - 6, self.rect.bottom + 8,
+                                 text.get_width() + 12, text.get_height() + 6)
+        shadow_rect = pygame.Rect(self.rect.x + 5, self.rect.y + 5, self.rect.width + 10, self.rect.height + 10)
+        panel_rect = self.panel_rect()
+
+        bounds = self.rect.union(shadow_rect).union(label_rect)
+        if with_panel:
+            bounds.union_ip(self.panel_area(panel_rect))
+        sprite = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        ox, oy = -bounds.x, -bounds.y
+
+        pygame.draw.rect(sprite, SHADOW, shadow_rect.move(ox, oy), border_radius=8)
+
+        body = self.rect.move(ox, oy)
         for i in range(self.rect.height):
             factor = 1 - (i / self.rect.height) * 0.3
             color = tuple(int(c * factor) for c in self.color)
-            pygame.draw.rect(surface, color, (self.rect.x, self.rect.y + i, self.rect.width, 1))
+            pygame.draw.rect(sprite, color, (body.x, body.y + i, body.width, 1))
 
         border_color = tuple(max(0, c - 40) for c in self.color)
-        pygame.draw.rect(surface, border_color, self.rect, 4, border_radius=5)
+        pygame.draw.rect(sprite, border_color, body, 4, border_radius=5)
 
         window_cols = 3
         window_rows = 5
@@ -106,245 +176,278 @@ class Building:
 
         for row in range(window_rows):
             for col in range(window_cols):
-                wx = self.rect.x + 10 + col * window_w
-                wy = self.rect.y + 15 + row * window_h
-                window_color = (255, 255, 200) if random.random() > 0.3 else (200, 220, 255)
-                pygame.draw.rect(surface, window_color, (wx, wy, window_w - 5, window_h - 5), border_radius=2)
-                pygame.draw.rect(surface, (100, 100, 100), (wx, wy, window_w - 5, window_h - 5), 1, border_radius=2)
+                wx = body.x + 10 + col * window_w
+                wy = body.y + 15 + row * window_h
+                window_color = (255, 255, 200) if self.window_lit[row * window_cols + col] else (200, 220, 255)
+                pygame.draw.rect(sprite, window_color, (wx, wy, window_w - 5, window_h - 5), border_radius=2)
+                pygame.draw.rect(sprite, (100, 100, 100), (wx, wy, window_w - 5, window_h - 5), 1, border_radius=2)
+
+        if with_panel:
+            self.draw_panel(sprite, panel_rect.move(ox, oy))
+
+        # Fundo do nome numa Surface própria: o blit mistura com a sombra
+        # embaixo, como no desenho direto na tela (draw.rect só substituiria)
+        label_bg = pygame.Surface(label_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(label_bg, (*BLACK, 180), label_bg.get_rect(), border_radius=8)
+        sprite.blit(label_bg, label_rect.move(ox, oy))
+        sprite.blit(text, (label_rect.x + 6 + ox, label_rect.y + 3 + oy))
+
+        self.sprite = sprite
+        self.sprite_offset = bounds.topleft
+
+    def bounds(self):
+        # Área total ocupada pelo prédio, incluindo painel animado, sombra e nome
+        # Maior painel da animação (animation = 1), com a sombra
+        area = self.rect.union(self.panel_area(self.animated_panel_rect(1.0)))
+        if self.sprite is not None:
+            area.union_ip(pygame.Rect(self.sprite_offset, self.sprite.get_size()))
+        return area
+
+    def dirty_rect(self):
+        # Só muda quando o hover muda ou durante a animação de instalação
+        state = (self.hover, self.has_solar, self.install_animation > 0)
+        if state == self.drawn_state and self.install_animation <= 0:
+            return None
+        return self.bounds()
+
+    def release(self):
+        # Fora da tela: libera o sprite (é refeito quando o prédio voltar)
+        self.sprite = None
+        self.sprite_key = None
+        self.hover_surf = None
+        self.drawn_state = None
+
+    def draw(self, surface, camera_x=0, alpha=1.0):
+        self.drawn_state = (self.hover, self.has_solar, self.install_animation > 0)
+
+        # Só refaz o sprite quando o estado do prédio muda
+        with_panel = self.has_solar and self.install_animation <= 0
+        key = (self.rect.topleft, self.rect.size, with_panel)
+        if key != self.sprite_key:
+            self.bake(with_panel)
+            self.sprite_key = key
+
+        surface.blit(self.sprite, (self.sprite_offset[0] - camera_x, self.sprite_offset[1]))
 
         if self.hover and not self.has_solar:
-            s = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(s, (255, 255, 255, 80), (0, 0, self.rect.width, self.rect.height), border_radius=5)
-            surface.blit(s, self.rect.topleft)
-
-        if self.has_solar:
-            panel_y = self.rect.y - 25
-            panel_rect = pygame.Rect(self.rect.x + 5, panel_y, self.rect.width - 10, 22)
-            if self.install_animation > 0:
-                scale = 1 + self.install_animation * 0.3
-                panel_rect.inflate_ip(int((scale - 1) * panel_rect.width), int((scale - 1) * panel_rect.height))
-
-            shadow_panel = pygame.Surface((panel_rect.width + 4, panel_rect.height + 4), pygame.SRCALPHA)
-            pygame.draw.rect(shadow_panel, SHADOW, (0, 0, panel_rect.width + 4, panel_rect.height + 4), border_radius=4)
-            surface.blit(shadow_panel, (panel_rect.x + 2, panel_rect.y + 2))
-
-            pygame.draw.rect(surface, PANEL_DARK, panel_rect, border_radius=4)
-
-            cell_w = (panel_rect.width - 8) // 5
-            for i in range(5):
-                cell_x = panel_rect.x + 4 + i * cell_w
-                cell_rect = pygame.Rect(cell_x, panel_rect.y + 3, cell_w - 2, panel_rect.height - 6)
-                pygame.draw.rect(surface, PANEL_BLUE, cell_rect, border_radius=2)
-                highlight = pygame.Surface((cell_w - 2, 4), pygame.SRCALPHA)
-                pygame.draw.rect(highlight, (255, 255, 255, 100), (0, 0, cell_w - 2, 4))
-                surface.blit(highlight, (cell_x, panel_rect.y + 3))
-
-            pygame.draw.rect(surface, PANEL_DARK, panel_rect, 2, border_radius=4)
-
-        font = pygame.font.Font(None, 24)
-        text = font.render(self.name, True, WHITE)
-        text_bg = pygame.Surface((text.get_width() + 12, text.get_height() + 6), pygame.SRCALPHA)
-        pygame.draw.rect(text_bg, (*BLACK, 180), (0, 0, text.get_width() + 12, text.get_height() + 6), border_radius=8)
-        text_x = self.rect.centerx - text.get_width()//2 - 6
-        text_y = self.rect.bottom + 8
-        surface.blit(text_bg, (text_x, text_y))
-        surface.blit(text, (self.rect.centerx - text.get_width()//2, text_y + 3))
-
-class Cloud:
-    def __init__(self, x, y, speed):
-        self.x = x
-        self.y = y
-        self.speed = speed
-        self.size = random.randint(70, 120)
-
-    def update(self, dt):
-        self.x += self.speed * dt * 30
-        if self.x > WIDTH + 150:
-            self.x = -150
-
-    def draw(self, surface, storm=False):
-        color = (160, 160, 180) if storm else (255, 255, 255)
-        pygame.draw.circle(surface, color, (int(self.x), int(self.y)), self.size)
-        pygame.draw.circle(surface, color, (int(self.x + self.size*0.7), int(self.y)), int(self.size*0.8))
-        pygame.draw.circle(surface, color, (int(self.x + self.size*1.3), int(self.y)), int(self.size*0.7))
-        pygame.draw.ellipse(surface, color, (self.x - self.size, self.y - self.size//2, self.size*3, self.size*1.2))
-
-class Game:
-    def __init__(self):
+            if self.hover_surf is None:
+                self.hover_surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+                pygame.draw.rect(self.hover_surf, (255, 255, 255, 80), (0, 0, self.rect.width, self.rect.height), border_radius=5)
+            surface.blit(self.hover_surf, (self.rect.x - camera_x, self.rect.y))
+
+        # Animação de instalação (painel crescendo) desenhada por frame
+        if self.has_solar and self.install_animation > 0:
+            animation = self.prev_animation + (self.install_animation - self.prev_animation) * alpha
+            self.draw_panel(surface, self.animated_panel_rect(animation).move(-camera_x, 0))
+
+class Game(Simulation):
+    def __init__(self, assets=None, city_size=CITY_SIZE, seed=None):
+        # Dois fluxos de sorteio: self.rng (Simulation) decide a partida e
+        # self.fx_rng só o visual. Desenhar mais ou menos frames não muda o
+        # resultado, e com seed a sessão inteira se repete (ver replay.py).
+        self.fx_rng = random.Random(None if seed is None else f"visual:{seed}")
+        self.fx_time = 0.0
+        # Fração do próximo passo já decorrida (main loop): o desenho interpola
+        # nuvens, partículas e animações entre o passo anterior e o atual
+        self.render_alpha = 1.0
+
+        fx = self.fx_rng
+        self.clouds = CloudField(WIDTH, fx, CITY_CLOUD_LAYERS if city_size else CLOUD_LAYERS)
+        self.particles = ParticlePool()
+        self.particles.seed(fx.getrandbits(32))
+        self.rain = RainSystem(WIDTH, HEIGHT, RAIN_COLOR, RAIN_SPAWN_RATE, RAIN_MAX_DROPS)
+        self.rain.seed(fx.getrandbits(32))
+        self.storm_fx = StormEffects(WIDTH, HEIGHT, random.Random(fx.getrandbits(32)))
+
+        # Grama fixa (x, y, inclinação da ponta) e confetes, sorteados uma vez
+        self.grass_blades = [(i + fx.randint(-5, 5), GRASS_Y + fx.randint(0, 30), fx.randint(-3, 3))
+                             for i in range(0, WIDTH, 20)]
+        self.grass_layer = None
+        self.confetti = [[(fx.randint(0, WIDTH), fx.randint(0, HEIGHT), fx.choice(CONFETTI_COLORS), fx.randint(4, 12))
+                          for _ in range(CONFETTI_COUNT)] for _ in range(CONFETTI_SETS)]
+
+        # Modo de retângulos sujos (DIRTY_RECT_MODE ou --dirty-rects)
+        self.dirty = DirtyTracker(WIDTH, HEIGHT)
+        self.dirty_state = None
+        self.particles_drawn_rect = None
+        self.menu_sun = None
+
+        # Telas paradas (menu, tutorial, fim de jogo) compostas uma vez
+        self.layers = LayerCache((WIDTH, HEIGHT))
+
+        # Hover: atualizado só quando o mouse se move (ver update_hover)
+        self.mouse_pos = (0, 0)
+        self.hovered = None
+
+        # Câmera (rolagem horizontal) e prédios desenhados no último frame
+        self.camera_x = 0
+        self.scroll_dir = 0
+        self.dirty_camera_x = 0
+        self.drawn_buildings = set()
+        self.animating = []
+
+        # HUD retido: painel e barra prontos, textos só mudam com o valor
+        self.hud = Hud(WIDTH)
+
+        # Botões das telas: desenho e clique usam o mesmo registro
+        self.ui = UIRegistry()
+        self.register_buttons()
+
+        # --- CARREGAMENTO DE EFEITOS SONOROS (em segundo plano) ---
+        # Só são necessários na tempestade ou no fim da partida
+        self.assets = assets or AssetManager()
+        self.assets.load_sound("thunder", "trovao.mp3", 0.7)
+        self.assets.load_sound("victory", "vitoria.mp3", 0.6)
+        self.assets.load_sound("defeat", "derrota.mp3", 0.7)
+
+        params = {"city_size": city_size} if city_size else None
+        super().__init__(level=1, seed=seed, building_factory=Building, params=params)
         self.state = "menu"
-        self.level = 1
-        self.clouds = [Cloud(random.randint(0, WIDTH), random.randint(50, 150), random.uniform(0.5, 1.5)) for _ in range(5)]
-        self.particles = []
 
-        # --- CARREGAMENTO DE EFEITOS SONOROS ---
-        self.sfx_thunder = None
-        self.sfx_victory = None
-        self.sfx_defeat = None
+    def register_buttons(self):
+        ui = self.ui
+        ui.add("menu", Button((WIDTH//2 - 180, 420, 360, 80), self.render_play_button, self.open_tutorial, margin=15))
+
+        ui.add("tutorial", Button((WIDTH//2 - 150, 685, 300, 60),
+                                  plain_button(GRASS_GREEN, DARK_GREEN, "COMEÇAR!", 36, 20), self.restart))
+
+        ui.add("gameover", Button((WIDTH//2 - 200, 540, 400, 60),
+                                  plain_button((200, 60, 60), (150, 30, 30), "TENTAR NOVAMENTE", 40, 15), self.restart))
+        ui.add("gameover", Button((WIDTH//2 - 200, 620, 400, 60),
+                                  plain_button((100, 100, 100), (60, 60, 60), "MENU INICIAL", 40, 15), self.back_to_menu))
+
+        # Último nível: o mesmo botão recomeça do nível 1, em azul
+        btn_y = (HEIGHT - VICTORY_PANEL_H) // 2 + VICTORY_PANEL_H - 150
+        next_rect = (WIDTH//2 - 200, btn_y, 400, 55)
+        ui.add("victory", Button(next_rect, plain_button((76, 175, 80), (56, 142, 60), "PRÓXIMO NÍVEL", 36, 15),
+                                 self.next_level, visible=lambda: self.level < 3))
+        ui.add("victory", Button(next_rect, plain_button((30, 144, 255), (25, 118, 210), "JOGAR NOVAMENTE", 36, 15),
+                                 self.next_level, visible=lambda: self.level >= 3))
+        ui.add("victory", Button((WIDTH//2 - 200, btn_y + 70, 400, 55),
+                                 plain_button((139, 195, 74), (104, 159, 56), "MENU INICIAL", 36, 15), self.back_to_menu))
+
+    def render_play_button(self, surface, rect):
+        shadow_surf = pygame.Surface((rect.width + 10, rect.height + 10), pygame.SRCALPHA)
+        pygame.draw.rect(shadow_surf, (0, 0, 0, 80), (0, 0, rect.width + 10, rect.height + 10), border_radius=20)
+        surface.blit(shadow_surf, (rect.x + 5, rect.y + 5))
+
+        surface.blit(get_gradient(rect.size, GRASS_GREEN, BLACK, 0.2), rect.topleft)
+
+        pygame.draw.rect(surface, DARK_GREEN, rect, 5, border_radius=20)
+        play_text = render_text("JOGAR", 56, WHITE)
+        surface.blit(play_text, (rect.centerx - play_text.get_width()//2, rect.y + 20))
+
+    # --- AÇÕES DOS BOTÕES ---
+    def open_tutorial(self):
+        self.state = "tutorial"
+        self.level = 1
 
-        try:
-            self.sfx_thunder = pygame.mixer.Sound("trovao.mp3")
-            self.sfx_victory = pygame.mixer.Sound("vitoria.mp3")
-            self.sfx_defeat = pygame.mixer.Sound("derrota.mp3")
+    def restart(self):
+        self.reset_level()
+        self.state = "playing"
 
-            if self.sfx_thunder: self.sfx_thunder.set_volume(0.7)
-            if self.sfx_victory: self.sfx_victory.set_volume(0.6)
-            if self.sfx_defeat: self.sfx_defeat.set_volume(0.7)
-        except pygame.error:
-            print("Aviso: Alguns arquivos de som (trovao, vitoria ou derrota) não foram encontrados.")
+    def next_level(self):
+        self.level = self.level + 1 if self.level < 3 else 1
+        self.restart()
 
-        self.reset_level()
+    def back_to_menu(self):
+        self.state = "menu"
+        self.level = 1
+        try: pygame.mixer.music.set_volume(MUSIC_VOL_NORMAL)
+        except: pass
 
     def reset_level(self):
         # RESTAURA O VOLUME DA MÚSICA AO REINICIAR
         try: pygame.mixer.music.set_volume(MUSIC_VOL_NORMAL)
         except: pass
 
-        # --- REAJUSTE DE DIFICULDADE (ENERGIA INICIAL) ---
-        if self.level == 1:
-            self.energy_total = 100 # Fácil
-        elif self.level == 2:
-            self.energy_total = 70  # Médio (Começa com 70% de bateria)
-        elif self.level == 3:
-            self.energy_total = 50  # Hardcore (Começa com 50% de bateria)
-
-        self.time = 0
-        self.sun_level = 1.0
-        self.storm_active = False
-        self.storm_timer = 0
-        self.points = 0
-        self.co2_avoided = 0
-        self.panels_installed = 0
-        self.energy_generated = 0
-        self.particles = []
-        self.raindrops = []
-        self.lightning_flash = 0
-        self.game_over_delay_timer = 0
-
-        self.buildings = []
-        if self.level == 1:
-            self.create_level_1()
-        elif self.level == 2:
-            self.create_level_2()
-        elif self.level == 3:
-            self.create_level_3()
-
-    def create_level_1(self):
-        spacing = 250
-        start_x = 150
-        for i in range(3):
-            self.buildings.append(Building(start_x + i * spacing, 420, 160, 200, f"Casa {i+1}", 3, BUILDING_COLORS[i]))
-        self.target_time = 5 # 5 Segundos (Muito rápido para terminar)
-
-    def create_level_2(self):
-        spacing = 200
-        start_x = 100
-        names = ["Casa", "Escola", "Loja", "Mercado", "Hospital"]
-        # --- AUMENTO DE CONSUMO PARA EXIGIR 3 PAINÉIS ---
-        consumptions = [12, 11, 13, 12, 11]
-        for i in range(5):
-            self.buildings.append(Building(start_x + i * spacing, 400 + random.randint(-20, 20), 140, 210, names[i], consumptions[i], BUILDING_COLORS[i]))
-
-        # --- TEMPO REDUZIDO PARA PRESSÃO ---
-        self.target_time = 7 # Era 10s, agora 7s (Tempestade vem rápido)
+        super().reset_level()
 
-    def create_level_3(self):
-        spacing = 140
-        start_x = 50
-        names = ["Fábrica 1", "Indústria", "Usinagem", "Depósito", "DataCenter", "Metalúrgica", "Refinaria", "Complexo"]
-        # Consumo aumentado para nível difícil
-        consumptions = [6, 7, 8, 6, 9, 8, 9, 7]
-        for i in range(8):
-            self.buildings.append(Building(start_x + i * spacing, 390 + random.randint(-30, 30), 120, 220, names[i], consumptions[i], BUILDING_COLORS[i]))
-
-        # --- TEMPO REDUZIDO AINDA MAIS ---
-        self.target_time = 9 # Era 10s, agora 9s (Muito rápido para 8 prédios)
+        self.particles.clear()
+        self.rain.clear()
+        self.rain_active = False
+        self.storm_fx.clear()
+        self.hovered = None
+        self.camera_x = 0
+        self.drawn_buildings = set()
+        self.animating = []
+        self.update_hover()
+        self.dirty.mark_all()
 
     def update_rain(self, dt):
         if not self.storm_active:
-            self.raindrops = []
+            if self.rain_active:
+                self.rain.clear()
+                self.rain_active = False
             return
 
-        if random.random() < 0.8:
-            x = random.randint(0, WIDTH)
-            y = -10
-            speed = random.uniform(400, 700)
-            self.raindrops.append([x, y, speed])
-
-        for drop in self.raindrops:
-            drop[1] += drop[2] * dt
-        self.raindrops = [d for d in self.raindrops if d[1] < HEIGHT]
+        self.rain_active = True
+        self.rain.update(dt)
 
     def update(self, dt):
-        for cloud in self.clouds:
-            cloud.update(dt)
+        self.update_effects(dt)
+
+        if self.state != "playing":
+            return
+
+        # LÓGICA DO JOGO (simulation.py)
+        for event in self.step(dt):
+            self.on_sim_event(event)
 
-        self.particles = [p for p in self.particles if p.life > 0]
-        for particle in self.particles:
-            particle.update(dt)
+    def update_effects(self, dt):
+        # Só a parte visual (nuvens, partículas, animações, chuva)
+        self.fx_time += dt
+        self.clouds.update(dt)
 
-        for building in self.buildings:
-            building.update(dt)
+        self.particles.update(dt)
 
-        if self.lightning_flash > 0:
-            self.lightning_flash -= dt * 5
+        if self.scroll_dir:
+            self.scroll(self.scroll_dir * CAMERA_SPEED * dt)
 
+        # Só os prédios com animação de instalação em andamento
+        if self.animating:
+            for building in self.animating:
+                building.update(dt)
+            self.animating = [b for b in self.animating if b.install_animation > 0]
+
+        self.storm_fx.update(dt, self.storm_active and self.state == "playing")
         self.update_rain(dt)
 
-        if self.state != "playing":
-            return
+    def install(self, building):
+        if super().install(building):
+            self.animating.append(building)
+            return True
+        return False
 
-        # LÓGICA DO JOGO
-        if self.time < self.target_time:
-            self.time += dt
-
-            total_consumption = sum(b.consumption for b in self.buildings)
-            total_generation = sum(b.solar_generation * self.sun_level for b in self.buildings if b.has_solar)
-
-            net_energy = total_generation - total_consumption
-            self.energy_total += net_energy * dt
-            self.energy_generated += total_generation * dt
-            self.co2_avoided += total_generation * dt * 0.5
-
-            if net_energy > 0:
-                self.points += dt * 10
-
-            # --- CHECAGEM DE VITÓRIA IMEDIATA (SPEEDRUN) ---
-            if self.panels_installed == len(self.buildings):
-                # Bônus massivo pelo tempo que sobrou
-                time_left = self.target_time - self.time
-                self.points += time_left * 100
-                self.time = self.target_time # Ajusta tempo visual para 100%
-
-                self.state = "victory"
-                try: pygame.mixer.music.set_volume(MUSIC_VOL_LOW)
-                except: pass
-                if self.sfx_victory: self.sfx_victory.play()
-                return # Sai da função
-
-            # GAME OVER: Falta de energia
-            if self.energy_total <= 0:
-                self.energy_total = 0
-                self.state = "gameover"
-                try: pygame.mixer.music.set_volume(MUSIC_VOL_LOW)
-                except: pass
-                if self.sfx_defeat: self.sfx_defeat.play()
+    # --- CÂMERA ---
+    def view_rect(self):
+        # Área visível em coordenadas do mundo
+        return pygame.Rect(int(self.camera_x), 0, WIDTH, HEIGHT)
 
-        else:
-            # O TEMPO ACABOU -> TEMPESTADE IMEDIATA
-            if not self.storm_active:
-                self.storm_active = True
-                self.sun_level = 0.3
-                self.game_over_delay_timer = 0
-                try: pygame.mixer.music.set_volume(MUSIC_VOL_LOW)
-                except: pass
-                if self.sfx_thunder: self.sfx_thunder.play()
+    def scroll(self, dx):
+        camera_x = max(0, min(self.world_width - WIDTH, self.camera_x + dx))
+        if camera_x != self.camera_x:
+            self.camera_x = camera_x
+            self.update_hover()
+
+    def to_world(self, pos):
+        return (pos[0] + int(self.camera_x), pos[1])
 
-            self.game_over_delay_timer += dt
+    def visible_buildings(self):
+        return self.grid.query(self.view_rect().inflate(CULL_MARGIN * 2, 0))
 
-            # Se a tempestade durar 3 segundos, Game Over
-            if self.game_over_delay_timer >= 3.0:
-                self.state = "gameover"
-                if self.sfx_defeat: self.sfx_defeat.play()
+    def on_sim_event(self, event):
+        # Sons e volume da música para os eventos da simulação
+        try: pygame.mixer.music.set_volume(MUSIC_VOL_LOW)
+        except: pass
+
+        # Som ainda carregando? Espera um pouco; se não der tempo, pula
+        if event == "storm":
+            self.assets.play("thunder", SFX_WAIT)
+        elif event == "victory":
+            self.assets.play("victory", SFX_WAIT)
+        elif event == "defeat":
+            self.assets.play("defeat", SFX_WAIT)
 
     def draw(self, surface):
         if self.state == "menu":
@@ -358,53 +461,156 @@ class Game:
         elif self.state == "victory":
             self.draw_victory(surface)
 
+    def pace(self):
+        # Quanto movimento a tela atual precisa (ver pacing.py)
+        if self.state == "playing":
+            return ACTIVE
+        if self.state in ("menu", "victory"):
+            return AMBIENT
+        return STATIC
+
+    def static_layer(self):
+        # Telas que são uma única camada do LayerCache (a Viewport apresenta
+        # a versão já escalada dela)
+        if self.state in ("tutorial", "gameover"):
+            return self.state
+        return None
+
+    def sun_rect(self):
+        sun_size = int(65 * self.sun_level)
+        radius = sun_size + 35 + 4
+        return pygame.Rect(WIDTH - 120 - radius, 100 - radius, radius * 2, radius * 2)
+
+    def update_hover(self, mouse_pos=None):
+        # Chamado nos eventos de movimento do mouse (e quando os prédios mudam)
+        if mouse_pos is not None:
+            self.mouse_pos = mouse_pos
+        if self.hovered is not None:
+            self.hovered.hover = False
+        self.hovered = None
+        for building in self.grid.at(self.to_world(self.mouse_pos)):
+            if not building.has_solar:
+                building.hover = True
+                self.hovered = building
+                break
+
+    def report_dirty(self):
+        # Cada elemento informa a área que mudou desde o último frame
+        if self.state != self.dirty_state:
+            self.dirty_state = self.state
+            self.dirty.mark_all()
+
+        if self.state == "menu":
+            for rect in self.clouds.dirty_rects(self.render_alpha):
+                self.dirty.mark(rect)
+
+        elif self.state == "playing":
+            # Chuva e relâmpagos ocupam a tela toda: redesenho completo
+            if self.storm_active or self.storm_fx.flash > 0:
+                self.dirty.mark_all()
+                return
+
+            # Câmera andou: tudo muda de lugar
+            view = self.view_rect()
+            if view.x != self.dirty_camera_x:
+                self.dirty_camera_x = view.x
+                self.dirty.mark_all()
+                return
+
+            for rect in self.clouds.dirty_rects(self.render_alpha, view.x):
+                self.dirty.mark(rect)
+            self.dirty.mark(self.sun_rect())
+
+            for building in self.visible_buildings():
+                rect = building.dirty_rect()
+                if rect is not None:
+                    self.dirty.mark(rect.move(-view.x, 0))
+
+            particles_rect = self.particles.bounds()
+            if particles_rect is not None:
+                particles_rect.move_ip(-view.x, 0)
+            self.dirty.mark(particles_rect)
+            self.dirty.mark(self.particles_drawn_rect)
+            self.particles_drawn_rect = particles_rect
+
+            if self.hud.changed(self):
+                self.dirty.mark(HUD_RECT)
+
+        elif self.state == "victory":
+            # Confetes mudam de lugar a cada frame
+            self.dirty.mark_all()
+
+    def draw_dirty(self, surface):
+        # Redesenha só as áreas sujas (com clip) e devolve os retângulos alterados
+        self.report_dirty()
+        rects = self.dirty.collect()
+        if len(rects) == 1 and rects[0] == self.dirty.screen_rect:
+            self.draw(surface)
+        elif len(rects) <= MAX_CLIP_PASSES:
+            for rect in rects:
+                surface.set_clip(rect)
+                self.draw(surface)
+            surface.set_clip(None)
+        else:
+            # Muitas áreas: uma única passada recortada no retângulo que cobre todas
+            surface.set_clip(rects[0].unionall(rects[1:]))
+            self.draw(surface)
+            surface.set_clip(None)
+        return rects
+
     def draw_menu(self, surface):
-        for y in range(HEIGHT):
-            factor = y / HEIGHT
-            color = tuple(int(SKY_BLUE[i] * (1 - factor * 0.3)) for i in range(3))
-            pygame.draw.line(surface, color, (0, y), (WIDTH, y))
-
-        for cloud in self.clouds:
-            cloud.draw(surface)
-
-        sun_x, sun_y = WIDTH - 150, 100
-        for i in range(12):
-            angle = i * math.pi / 6
-            end_x = sun_x + int(math.cos(angle) * 110)
-            end_y = sun_y + int(math.sin(angle) * 110)
-            pygame.draw.line(surface, SUN_YELLOW, (sun_x, sun_y), (end_x, end_y), 6)
-        pygame.draw.circle(surface, SUN_YELLOW, (sun_x, sun_y), 70)
-        pygame.draw.circle(surface, (255, 240, 100), (sun_x, sun_y), 63)
+        # Só as nuvens se mexem. O céu com a camada do menu por cima vem
+        # pronto; por frame, só as áreas das nuvens são refeitas: céu, todas
+        # as nuvens num único blits e a camada do menu de novo por cima. As
+        # áreas são unidas antes para que nenhuma receba a camada duas vezes.
+        self.layers.blit(surface, "menu_frame", None, self.build_menu_frame)
+        sky = get_gradient((WIDTH, HEIGHT), SKY_BLUE, BLACK, 0.3)
+        overlay, _ = self.layers.get("menu", None, self.build_menu, alpha=True)
+
+        clip = surface.get_clip()
+        rects = [rect for rect in (r.clip(clip) for r in merge_rects(self.clouds.rects(self.render_alpha))) if rect]
+        if not rects:
+            return
+        for rect in rects:
+            surface.blit(sky, rect.topleft, rect)
+        surface.set_clip(rects[0].unionall(rects))
+        self.clouds.draw(surface, alpha=self.render_alpha)
+        surface.set_clip(clip)
+        for rect in rects:
+            surface.blit(overlay, rect.topleft, rect)
+
+    def build_menu_frame(self, surface):
+        surface.blit(get_gradient((WIDTH, HEIGHT), SKY_BLUE, BLACK, 0.3), (0, 0))
+        overlay, _ = self.layers.get("menu", None, self.build_menu, alpha=True)
+        surface.blit(overlay, (0, 0))
+
+    def build_menu(self, surface):
+        # Sol parado: sprite pronto (linhas grossas recortadas mudam de forma no modo de retângulos sujos)
+        if self.menu_sun is None:
+            self.menu_sun = pygame.Surface((240, 240), pygame.SRCALPHA)
+            for i in range(12):
+                angle = i * math.pi / 6
+                end_x = 120 + int(math.cos(angle) * 110)
+                end_y = 120 + int(math.sin(angle) * 110)
+                pygame.draw.line(self.menu_sun, SUN_YELLOW, (120, 120), (end_x, end_y), 6)
+            pygame.draw.circle(self.menu_sun, SUN_YELLOW, (120, 120), 70)
+            pygame.draw.circle(self.menu_sun, (255, 240, 100), (120, 120), 63)
+        surface.blit(self.menu_sun, (WIDTH - 150 - 120, 100 - 120))
 
         title_panel = pygame.Surface((900, 400), pygame.SRCALPHA)
         pygame.draw.rect(title_panel, (255, 255, 255, 240), (0, 0, 900, 400), border_radius=30)
         surface.blit(title_panel, (WIDTH//2 - 450, 150))
 
-        font_title = pygame.font.Font(None, 90)
-        title = font_title.render("Cidade Solar Inteligente", True, (30, 144, 255))
+        title = render_text("Cidade Solar Inteligente", 90, (30, 144, 255))
         surface.blit(title, (WIDTH//2 - title.get_width()//2, 180))
 
-        font_sub = pygame.font.Font(None, 42)
-        subtitle = font_sub.render("Energia Limpa e Sustentabilidade", True, GRASS_GREEN)
+        subtitle = render_text("Energia Limpa e Sustentabilidade", 42, GRASS_GREEN)
         surface.blit(subtitle, (WIDTH//2 - subtitle.get_width()//2, 270))
 
-        font_normal = pygame.font.Font(None, 32)
-        ods = font_normal.render("ODS 7: Energia Limpa | ODS 13: Ação Climática", True, (60, 60, 60))
+        ods = render_text("ODS 7: Energia Limpa | ODS 13: Ação Climática", 32, (60, 60, 60))
         surface.blit(ods, (WIDTH//2 - ods.get_width()//2, 330))
 
-        button_rect = pygame.Rect(WIDTH//2 - 180, 420, 360, 80)
-        shadow_surf = pygame.Surface((button_rect.width + 10, button_rect.height + 10), pygame.SRCALPHA)
-        pygame.draw.rect(shadow_surf, (0, 0, 0, 80), (0, 0, button_rect.width + 10, button_rect.height + 10), border_radius=20)
-        surface.blit(shadow_surf, (button_rect.x + 5, button_rect.y + 5))
-
-        for i in range(button_rect.height):
-            factor = i / button_rect.height
-            color = tuple(int(GRASS_GREEN[j] * (1 - factor * 0.2)) for j in range(3))
-            pygame.draw.rect(surface, color, (button_rect.x, button_rect.y + i, button_rect.width, 1))
-
-        pygame.draw.rect(surface, DARK_GREEN, button_rect, 5, border_radius=20)
-        play_text = pygame.font.Font(None, 56).render("JOGAR", True, WHITE)
-        surface.blit(play_text, (WIDTH//2 - play_text.get_width()//2, button_rect.y + 20))
+        self.ui.draw(surface, "menu")
 
         instructions = [
             "Clique nos prédios para instalar painéis solares",
@@ -413,7 +619,7 @@ class Game:
         ]
         y = 570
         for inst in instructions:
-            text = font_normal.render(inst, True, (40, 40, 40))
+            text = render_text(inst, 32, (40, 40, 40))
             bg = pygame.Surface((text.get_width() + 30, text.get_height() + 20), pygame.SRCALPHA)
             pygame.draw.rect(bg, (255, 255, 255, 200), (0, 0, bg.get_width(), bg.get_height()), border_radius=15)
             surface.blit(bg, (WIDTH//2 - bg.get_width()//2, y - 10))
@@ -421,22 +627,19 @@ class Game:
             y += 50
 
     def draw_tutorial(self, surface):
-        for y in range(HEIGHT):
-            factor = y / HEIGHT
-            color = tuple(int(SKY_BLUE[i] * (1 - factor * 0.3)) for i in range(3))
-            pygame.draw.line(surface, color, (0, y), (WIDTH, y))
+        # Tela inteira parada: um único blit
+        self.layers.blit(surface, "tutorial", None, self.build_tutorial)
+
+    def build_tutorial(self, surface):
+        surface.blit(get_gradient((WIDTH, HEIGHT), SKY_BLUE, BLACK, 0.3), (0, 0))
 
         # Painel de fundo
         panel = pygame.Surface((1100, 720), pygame.SRCALPHA) # Aumentei um pouco a largura do painel
         pygame.draw.rect(panel, (255, 255, 255, 250), (0, 0, 1100, 720), border_radius=30)
         surface.blit(panel, (WIDTH//2 - 550, 40))
 
-        font_title = pygame.font.Font(None, 70)
-        font_subtitle = pygame.font.Font(None, 36)
-        font_normal = pygame.font.Font(None, 28) # Fonte um pouco maior
-        font_small = pygame.font.Font(None, 24)  # Fonte um pouco maior
 
-        title = font_title.render("Como Jogar?", True, (30, 144, 255))
+        title = render_text("Como Jogar?", 70, (30, 144, 255))
         surface.blit(title, (WIDTH//2 - title.get_width()//2, 60))
 
         # Faixa do Objetivo
@@ -444,7 +647,7 @@ class Game:
         pygame.draw.rect(objective_bg, (76, 175, 80, 40), (0, 0, 1000, 50), border_radius=15)
         surface.blit(objective_bg, (WIDTH//2 - 500, 120))
 
-        objective = font_subtitle.render("OBJETIVO: Manter sua cidade iluminada com energia solar!", True, (76, 175, 80))
+        objective = render_text("OBJETIVO: Manter sua cidade iluminada com energia solar!", 36, (76, 175, 80))
         surface.blit(objective, (WIDTH//2 - objective.get_width()//2, 132))
 
         instructions = [
@@ -503,13 +706,13 @@ class Game:
                 y = start_y + ((i-3) * 140)
 
             # Desenha o Bloco
-            title_text = font_normal.render(inst["title"], True, inst["color"])
+            title_text = render_text(inst["title"], 28, inst["color"])
             surface.blit(title_text, (x, y))
 
-            desc_text = font_small.render(inst["desc"], True, (40, 40, 40))
+            desc_text = render_text(inst["desc"], 24, (40, 40, 40))
             surface.blit(desc_text, (x, y + 28))
 
-            detail_text = font_small.render(inst["detail"], True, (100, 100, 100))
+            detail_text = render_text(inst["detail"], 24, (100, 100, 100))
             surface.blit(detail_text, (x, y + 50))
 
         # Dica final
@@ -517,148 +720,84 @@ class Game:
         pygame.draw.rect(tip_bg, (33, 150, 243, 40), (0, 0, 1000, 40), border_radius=15)
         surface.blit(tip_bg, (WIDTH//2 - 500, 630))
 
-        tip = font_normal.render("DICA: Instale painéis em TODOS os prédios o mais rápido possível!", True, (33, 150, 243))
+        tip = render_text("DICA: Instale painéis em TODOS os prédios o mais rápido possível!", 28, (33, 150, 243))
         surface.blit(tip, (WIDTH//2 - tip.get_width()//2, 640))
 
         # Botão Começar
-        button_rect = pygame.Rect(WIDTH//2 - 150, 685, 300, 60)
-        pygame.draw.rect(surface, GRASS_GREEN, button_rect, border_radius=15)
-        pygame.draw.rect(surface, DARK_GREEN, button_rect, 4, border_radius=15)
-        continue_text = font_subtitle.render("COMEÇAR!", True, WHITE)
-        surface.blit(continue_text, (WIDTH//2 - continue_text.get_width()//2, 705))
+        self.ui.draw(surface, "tutorial")
 
     def draw_game(self, surface):
+        with profiler.section("sky"):
+            if self.storm_active:
+                surface.blit(get_gradient((WIDTH, HEIGHT), SKY_STORM, BLACK, 0.2), (0, 0))
+            else:
+                surface.blit(get_gradient((WIDTH, HEIGHT), SKY_BLUE, BLACK, 0.3), (0, 0))
+
         if self.storm_active:
-            for y in range(HEIGHT):
-                factor = y / HEIGHT
-                color = tuple(int(SKY_STORM[i] * (1 - factor * 0.2)) for i in range(3))
-                pygame.draw.line(surface, color, (0, y), (WIDTH, y))
-
-            for drop in self.raindrops:
-                pygame.draw.line(surface, RAIN_COLOR, (drop[0], drop[1]), (drop[0], drop[1]+15), 2)
-
-            if random.random() < 0.02:
-                self.lightning_flash = 1.0
-                x = random.randint(100, WIDTH - 100)
-                points = [(x, 0)]
-                y = 0
-                for _ in range(6):
-                    x += random.randint(-40, 40)
-                    y += random.randint(50, 100)
-                    points.append((x, y))
-                pygame.draw.lines(surface, WHITE, False, points, 5)
-                pygame.draw.lines(surface, (200, 200, 255), False, points, 2)
-        else:
-            for y in range(HEIGHT):
-                factor = y / HEIGHT
-                color = tuple(int(SKY_BLUE[i] * (1 - factor * 0.3)) for i in range(3))
-                pygame.draw.line(surface, color, (0, y), (WIDTH, y))
+            with profiler.section("rain"):
+                self.rain.draw(surface)
+            with profiler.section("storm"):
+                self.storm_fx.draw_bolt(surface)
 
-        for cloud in self.clouds:
-            cloud.draw(surface, self.storm_active)
+        with profiler.section("clouds"):
+            self.clouds.draw(surface, self.storm_active, self.render_alpha, int(self.camera_x))
 
-        if not self.storm_active:
-            sun_x, sun_y = WIDTH - 120, 100
-            sun_size = int(65 * self.sun_level)
-            for i in range(12):
-                angle = i * math.pi / 6 + self.time
-                end_x = sun_x + int(math.cos(angle) * (sun_size + 35))
-                end_y = sun_y + int(math.sin(angle) * (sun_size + 35))
-                pygame.draw.line(surface, SUN_YELLOW, (sun_x, sun_y), (end_x, end_y), 5)
-
-            pygame.draw.circle(surface, SUN_YELLOW, (sun_x, sun_y), sun_size)
-            pygame.draw.circle(surface, (255, 240, 100), (sun_x, sun_y), sun_size - 5)
-
-        grass_height = HEIGHT - 150
-        for y in range(grass_height, HEIGHT):
-            factor = (y - grass_height) / (HEIGHT - grass_height)
-            color = tuple(int(GRASS_GREEN[i] * (1 - factor * 0.3)) for i in range(3))
-            pygame.draw.line(surface, color, (0, y), (WIDTH, y))
-
-        for i in range(0, WIDTH, 20):
-            blade_x = i + random.randint(-5, 5)
-            blade_y = grass_height + random.randint(0, 30)
-            pygame.draw.line(surface, DARK_GREEN, (blade_x, blade_y),
-                           (blade_x + random.randint(-3, 3), blade_y - 15), 2)
-
-        mouse_pos = pygame.mouse.get_pos()
-        for building in self.buildings:
-            building.hover = building.rect.collidepoint(mouse_pos) and not building.has_solar
-            building.draw(surface)
-
-        for particle in self.particles:
-            particle.draw(surface)
-
-        if self.lightning_flash > 0:
-            flash_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            alpha = int(180 * self.lightning_flash)
-            flash_surface.fill((255, 255, 255, alpha))
-            surface.blit(flash_surface, (0,0))
-
-        self.draw_hud(surface)
+        with profiler.section("sky"):
+            if not self.storm_active:
+                sun_x, sun_y = WIDTH - 120, 100
+                sun_size = int(65 * self.sun_level)
+                for i in range(12):
+                    angle = i * math.pi / 6 + self.time
+                    end_x = sun_x + int(math.cos(angle) * (sun_size + 35))
+                    end_y = sun_y + int(math.sin(angle) * (sun_size + 35))
+                    pygame.draw.line(surface, SUN_YELLOW, (sun_x, sun_y), (end_x, end_y), 5)
+
+                pygame.draw.circle(surface, SUN_YELLOW, (sun_x, sun_y), sun_size)
+                pygame.draw.circle(surface, (255, 240, 100), (sun_x, sun_y), sun_size - 5)
+
+            surface.blit(get_gradient((WIDTH, HEIGHT - GRASS_Y), GRASS_GREEN, BLACK, 0.3), (0, GRASS_Y))
+
+            # Folhas de grama em posições fixas, desenhadas uma vez numa camada
+            if self.grass_layer is None:
+                self.grass_layer = pygame.Surface((WIDTH, 60), pygame.SRCALPHA)
+                top = GRASS_Y - 20
+                for blade_x, blade_y, tip in self.grass_blades:
+                    pygame.draw.line(self.grass_layer, DARK_GREEN, (blade_x, blade_y - top),
+                                     (blade_x + tip, blade_y - 15 - top), 2)
+            surface.blit(self.grass_layer, (0, GRASS_Y - 20))
+
+        with profiler.section("buildings"):
+            # Só os prédios perto da tela; os que saíram liberam o sprite
+            visible = self.visible_buildings()
+            for building in visible:
+                building.draw(surface, int(self.camera_x), self.render_alpha)
+            for building in self.drawn_buildings.difference(visible):
+                building.release()
+            self.drawn_buildings = set(visible)
+
+        with profiler.section("particles"):
+            self.particles.draw(surface, self.view_rect(), self.render_alpha)
+
+        with profiler.section("storm"):
+            self.storm_fx.draw_flash(surface)
+
+        with profiler.section("hud"):
+            self.draw_hud(surface)
 
     def draw_hud(self, surface):
-        font = pygame.font.Font(None, 32)
-        font_small = pygame.font.Font(None, 26)
-
-        hud_panel = pygame.Surface((380, 320), pygame.SRCALPHA)
-        pygame.draw.rect(hud_panel, (255, 255, 255, 230), (0, 0, 380, 320), border_radius=20)
-        surface.blit(hud_panel, (20, 20))
-
-        bar_width = 340
-        bar_height = 40
-        bar_x, bar_y = 40, 40
-
-        pygame.draw.rect(surface, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height), border_radius=20)
-        energy_percent = max(0, min(1, self.energy_total / 100))
-        energy_width = int(bar_width * energy_percent)
-
-        if energy_percent > 0.5:
-            color1, color2 = (76, 175, 80), (129, 199, 132)
-        elif energy_percent > 0.25:
-            color1, color2 = (255, 167, 38), (255, 202, 40)
-        else:
-            color1, color2 = (244, 67, 54), (239, 83, 80)
-
-        for i in range(energy_width):
-            factor = i / bar_width
-            color = tuple(int(color1[j] + (color2[j] - color1[j]) * factor) for j in range(3))
-            pygame.draw.rect(surface, color, (bar_x + i, bar_y, 1, bar_height))
-
-        pygame.draw.rect(surface, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height), 3, border_radius=20)
-        energy_text = font.render(f"Energia: {int(self.energy_total)}", True, (50, 50, 50))
-        surface.blit(energy_text, (bar_x + 10, bar_y + 8))
-
-        y_offset = 100
-        info_items = [
-            (f"Nível: {self.level}", (30, 144, 255)),
-            (f"Tempo: {int(min(self.time, self.target_time))}s / {self.target_time}s", (100, 100, 100)),
-            (f"Painéis: {self.panels_installed}", (255, 152, 0)),
-            (f"Pontos: {int(self.points)}", (156, 39, 176)),
-            (f"CO2: {int(self.co2_avoided)} kg", (76, 175, 80))
-        ]
-
-        for text_str, color in info_items:
-            text = font_small.render(text_str, True, color)
-            surface.blit(text, (40, y_offset))
-            y_offset += 40
-
-        if self.storm_active:
-            alert_panel = pygame.Surface((300, 60), pygame.SRCALPHA)
-            pygame.draw.rect(alert_panel, (255, 235, 59, 240), (0, 0, 300, 60), border_radius=15)
-            surface.blit(alert_panel, (WIDTH//2 - 150, 20))
-            storm_text = font.render("TEMPESTADE!", True, (198, 40, 40))
-            surface.blit(storm_text, (WIDTH//2 - storm_text.get_width()//2, 35))
+        self.hud.draw(surface, self)
 
     def draw_gameover(self, surface):
+        # Refeita só quando algum valor exibido muda
+        key = (self.energy_total <= 0, self.target_time, self.panels_installed, len(self.buildings),
+               int(self.co2_avoided), int(self.points))
+        self.layers.blit(surface, "gameover", key, self.build_gameover)
+
+    def build_gameover(self, surface):
         # --- FUNDO VERMELHO (DERROTA) ---
-        for y in range(HEIGHT):
-            factor = y / HEIGHT
-            # Gradiente de Vermelho Escuro para Preto
-            # R: 60->20, G: 0, B: 0
-            r = int(60 * (1 - factor * 0.5))
-            color = (r, 0, 0)
-            pygame.draw.line(surface, color, (0, y), (WIDTH, y))
+        # Gradiente de Vermelho Escuro para Preto
+        # R: 60->30, G: 0, B: 0
+        surface.blit(get_gradient((WIDTH, HEIGHT), (60, 0, 0), BLACK, 0.5), (0, 0))
 
         # Painel central
         panel = pygame.Surface((700, 550), pygame.SRCALPHA)
@@ -667,11 +806,9 @@ class Game:
         pygame.draw.rect(panel, (200, 50, 50), (0, 0, 700, 550), 3, border_radius=30)
         surface.blit(panel, (WIDTH//2 - 350, 120))
 
-        font_title = pygame.font.Font(None, 90)
-        font_normal = pygame.font.Font(None, 40)
 
         # Título em Vermelho Neon
-        title = font_title.render("APAGÃO!", True, (255, 80, 80))
+        title = render_text("APAGÃO!", 90, (255, 80, 80))
         surface.blit(title, (WIDTH//2 - title.get_width()//2, 150))
 
         if self.energy_total <= 0:
@@ -679,7 +816,7 @@ class Game:
         else:
             msg = "Tempo esgotado! A tempestade venceu."
 
-        subtitle = font_normal.render(msg, True, (255, 200, 200))
+        subtitle = render_text(msg, 40, (255, 200, 200))
         surface.blit(subtitle, (WIDTH//2 - subtitle.get_width()//2, 250))
 
         stats = [
@@ -691,45 +828,32 @@ class Game:
 
         y = 330
         for stat, color in stats:
-            text = font_normal.render(stat, True, color)
+            text = render_text(stat, 40, color)
             surface.blit(text, (WIDTH//2 - text.get_width()//2, y))
             y += 55
 
         # Botões VERMELHOS (Para manter o tema de alerta)
-        button_rect = pygame.Rect(WIDTH//2 - 200, 540, 400, 60)
-        pygame.draw.rect(surface, (200, 60, 60), button_rect, border_radius=15) # Vermelho botão
-        pygame.draw.rect(surface, (150, 30, 30), button_rect, 4, border_radius=15) # Borda escura
-        restart_text = font_normal.render("TENTAR NOVAMENTE", True, WHITE)
-        surface.blit(restart_text, (WIDTH//2 - restart_text.get_width()//2, 555))
-
-        menu_rect = pygame.Rect(WIDTH//2 - 200, 620, 400, 60)
-        pygame.draw.rect(surface, (100, 100, 100), menu_rect, border_radius=15) # Cinza para menu
-        pygame.draw.rect(surface, (60, 60, 60), menu_rect, 4, border_radius=15)
-        menu_text = font_normal.render("MENU INICIAL", True, WHITE)
-        surface.blit(menu_text, (WIDTH//2 - menu_text.get_width()//2, 635))
+        self.ui.draw(surface, "gameover")
 
     def draw_victory(self, surface):
         # --- FUNDO VERDE/AZUL (VITÓRIA) ---
-        for y in range(HEIGHT):
-            factor = y / HEIGHT
-            # Gradiente de Verde Limão para Verde Floresta
-            r = int(100 * (1 - factor))
-            g = int(200 + factor * 30) # Muito verde
-            b = int(100 + factor * 100)
-            color = (r, g, b)
-            if y < 5: color = (255, 255, 255) # Brilho no topo
-            pygame.draw.line(surface, color, (0, y), (WIDTH, y))
+        # Gradiente de Verde Limão para Verde Floresta (muito verde)
+        surface.blit(get_gradient((WIDTH, HEIGHT), (100, 200, 100), (0, 230, 200)), (0, 0))
+        surface.fill(WHITE, (0, 0, WIDTH, 5)) # Brilho no topo
 
         # Confetes coloridos
-        for _ in range(40): # Mais confetes!
-            x = random.randint(0, WIDTH)
-            y = random.randint(0, HEIGHT)
-            color = random.choice([(255, 255, 0), (255, 100, 100), (100, 255, 100), (100, 200, 255)])
-            size = random.randint(4, 12)
+        # Conjuntos pré-sorteados, trocados pelo tempo (não a cada frame desenhado)
+        for x, y, color, size in self.confetti[int(self.fx_time * CONFETTI_RATE) % CONFETTI_SETS]:
             pygame.draw.circle(surface, color, (x, y), size)
 
+        # Painel, textos e botões: camada pronta por cima dos confetes
+        key = (self.level, self.panels_installed, len(self.buildings), int(self.energy_generated),
+               int(self.co2_avoided), int(self.points))
+        self.layers.blit(surface, "victory", key, self.build_victory, alpha=True)
+
+    def build_victory(self, surface):
         # Painel central (Branco com leve tom verde)
-        panel_h = 680
+        panel_h = VICTORY_PANEL_H
         panel_y = (HEIGHT - panel_h) // 2
         panel = pygame.Surface((850, panel_h), pygame.SRCALPHA)
         pygame.draw.rect(panel, (240, 255, 240, 240), (0, 0, 850, panel_h), border_radius=30)
@@ -737,15 +861,12 @@ class Game:
         pygame.draw.rect(panel, (76, 175, 80), (0, 0, 850, panel_h), 4, border_radius=30)
         surface.blit(panel, (WIDTH//2 - 425, panel_y))
 
-        font_title = pygame.font.Font(None, 80)
-        font_normal = pygame.font.Font(None, 36)
-        font_small = pygame.font.Font(None, 28)
 
         # Título Verde Escuro
-        title = font_title.render("PARABÉNS!", True, (30, 100, 30))
+        title = render_text("PARABÉNS!", 80, (30, 100, 30))
         surface.blit(title, (WIDTH//2 - title.get_width()//2, panel_y + 40))
 
-        subtitle = font_normal.render("Você criou uma cidade sustentável!", True, (50, 150, 50))
+        subtitle = render_text("Você criou uma cidade sustentável!", 36, (50, 150, 50))
         surface.blit(subtitle, (WIDTH//2 - subtitle.get_width()//2, panel_y + 110))
 
         stats = [
@@ -758,7 +879,7 @@ class Game:
 
         y = panel_y + 170
         for stat, color in stats:
-            text = font_normal.render(stat, True, color)
+            text = render_text(stat, 36, color)
             # Fundo branco suave atrás do texto para ler melhor
             bg = pygame.Surface((text.get_width() + 40, text.get_height() + 10), pygame.SRCALPHA)
             pygame.draw.rect(bg, (255, 255, 255, 180), (0, 0, bg.get_width(), bg.get_height()), border_radius=10)
@@ -767,7 +888,7 @@ class Game:
             surface.blit(text, (WIDTH//2 - text.get_width()//2, y))
             y += 45
 
-        tips_title = font_normal.render("Dicas para economizar energia:", True, (0, 100, 0))
+        tips_title = render_text("Dicas para economizar energia:", 36, (0, 100, 0))
         surface.blit(tips_title, (WIDTH//2 - tips_title.get_width()//2, y + 20))
 
         if self.level == 1:
@@ -779,112 +900,168 @@ class Game:
 
         y += 55
         for tip in tips:
-            text = font_small.render(tip, True, (60, 60, 60))
+            text = render_text(tip, 28, (60, 60, 60))
             surface.blit(text, (WIDTH//2 - text.get_width()//2, y))
             y += 30
 
-        btn_y_start = panel_y + panel_h - 150
-
         # Botões VERDES (Tema de Sucesso)
-        button_rect = pygame.Rect(WIDTH//2 - 200, btn_y_start, 400, 55)
-        if self.level < 3:
-            pygame.draw.rect(surface, (76, 175, 80), button_rect, border_radius=15) # Verde Clássico
-            pygame.draw.rect(surface, (56, 142, 60), button_rect, 4, border_radius=15)
-            next_text = font_normal.render("PRÓXIMO NÍVEL", True, WHITE)
-        else:
-            pygame.draw.rect(surface, (30, 144, 255), button_rect, border_radius=15) # Azul para zerar
-            pygame.draw.rect(surface, (25, 118, 210), button_rect, 4, border_radius=15)
-            next_text = font_normal.render("JOGAR NOVAMENTE", True, WHITE)
-        surface.blit(next_text, (WIDTH//2 - next_text.get_width()//2, btn_y_start + 15))
-
-        menu_rect = pygame.Rect(WIDTH//2 - 200, btn_y_start + 70, 400, 55)
-        pygame.draw.rect(surface, (139, 195, 74), menu_rect, border_radius=15) # Verde mais claro
-        pygame.draw.rect(surface, (104, 159, 56), menu_rect, 4, border_radius=15)
-        menu_text = font_normal.render("MENU INICIAL", True, WHITE)
-        surface.blit(menu_text, (WIDTH//2 - menu_text.get_width()//2, btn_y_start + 85))
+        self.ui.draw(surface, "victory")
 
     def handle_click(self, pos):
-        if self.state == "menu":
-            button_rect = pygame.Rect(WIDTH//2 - 180, 420, 360, 80)
-            if button_rect.collidepoint(pos):
-                self.state = "tutorial"
-                self.level = 1
-
-        elif self.state == "tutorial":
-            button_rect = pygame.Rect(WIDTH//2 - 150, 710, 300, 60)
-            if button_rect.collidepoint(pos):
-                self.reset_level()
-                self.state = "playing"
-
-        elif self.state == "playing":
-            for building in self.buildings:
-                if building.rect.collidepoint(pos):
-                    if building.install_solar():
-                        self.panels_installed += 1
-                        self.points += 50
-                        for _ in range(15):
-                            self.particles.append(Particle(building.rect.centerx, building.rect.top - 25, (30, 144, 255)))
+        if self.state == "playing":
+            building = self.click(self.to_world(pos))
+            if building:
+                self.update_hover(pos)
+                self.particles.emit(building.rect.centerx, building.rect.top - 25, (30, 144, 255), INSTALL_BURST_PARTICLES)
+        else:
+            self.ui.click(self.state, pos)
+
+def init_display(window_size=None, fullscreen=False):
+    # A tela só é criada aqui, para que o módulo possa ser importado sem display
+    pygame.init()
+    pygame.mixer.init()
+    if fullscreen:
+        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)  # Resolução do monitor
+    else:
+        screen = pygame.display.set_mode(window_size or (WIDTH, HEIGHT), pygame.RESIZABLE)
+    pygame.display.set_caption("Cidade Solar Inteligente")
+    return screen
+
+def main(record_path=None, replay_path=None, window_size=None, fullscreen=False, dirty_rects=DIRTY_RECT_MODE):
+    screen = init_display(window_size, fullscreen)
+    viewport = Viewport((WIDTH, HEIGHT))
+    viewport.resize(screen)
+
+    # Replay: seed, passos de simulação e cliques de cada frame vêm do arquivo
+    replay = Replay.load(replay_path) if replay_path else None
+    frames = iter(replay.frames) if replay else None
+    next_frame = next(frames, None) if replay else None
+    seed = replay.seed if replay else random.SystemRandom().getrandbits(32)
+    city_size = replay.city_size if replay else CITY_SIZE
+    recorder = Recorder(record_path, seed, city_size) if record_path else None
+
+    # Música primeiro na fila, depois os efeitos (Game)
+    assets = AssetManager()
+    assets.load_music("musica.mp3", MUSIC_VOL_NORMAL)
+
+    game = Game(assets, city_size, seed)
+    running = True
+    first_frame = True
+    accumulator = 0.0  # Tempo real ainda não simulado
+    skipped = 0        # Frames seguidos sem desenho
 
-        elif self.state == "gameover":
-            button_rect = pygame.Rect(WIDTH//2 - 200, 540, 400, 60)
-            if button_rect.collidepoint(pos):
-                self.reset_level()
-                self.state = "playing"
-
-            menu_rect = pygame.Rect(WIDTH//2 - 200, 620, 400, 60)
-            if menu_rect.collidepoint(pos):
-                self.state = "menu"
-                self.level = 1
-                try: pygame.mixer.music.set_volume(MUSIC_VOL_NORMAL)
-                except: pass
+    # Buffer persistente: no modo de retângulos sujos só as áreas alteradas vão para a tela
+    back_buffer = pygame.Surface((WIDTH, HEIGHT)).convert() if dirty_rects else None
 
-        elif self.state == "victory":
-            panel_h = 680
-            panel_y = (HEIGHT - panel_h) // 2
-            btn_y_start = panel_y + panel_h - 150
-
-            button_rect = pygame.Rect(WIDTH//2 - 200, btn_y_start, 400, 55)
-            if button_rect.collidepoint(pos):
-                if self.level < 3:
-                    self.level += 1
-                else:
-                    self.level = 1
-                self.reset_level()
-                self.state = "playing"
-
-            menu_rect = pygame.Rect(WIDTH//2 - 200, btn_y_start + 70, 400, 55)
-            if menu_rect.collidepoint(pos):
-                self.state = "menu"
-                self.level = 1
-                try: pygame.mixer.music.set_volume(MUSIC_VOL_NORMAL)
-                except: pass
-
-def main():
-    try:
-        pygame.mixer.music.load("musica.mp3")
-        pygame.mixer.music.set_volume(MUSIC_VOL_NORMAL)
-        pygame.mixer.music.play(-1)
-    except pygame.error:
-        print("Nenhuma música encontrada. O jogo rodará sem som.")
-
-    game = Game()
-    running = True
+    # Replay segue o relógio do arquivo: sempre no ritmo cheio
+    pacer = FramePacer(clock, FPS)
 
     while running:
-        dt = clock.tick(FPS) / 1000.0
+        elapsed, events = pacer.tick(ACTIVE if replay else game.pace())
+        accumulator += elapsed
+        profiler.begin_frame()
 
-        for event in pygame.event.get():
+        # Cliques e rolagens do frame, na ordem (gravados com --record)
+        inputs = []
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.MOUSEWHEEL:
+                inputs.append((WHEEL, -event.y * CAMERA_WHEEL_STEP, 0))
+            elif event.type == pygame.MOUSEMOTION:
+                game.update_hover(viewport.to_logical(event.pos))
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                game.handle_click(event.pos)
+                inputs.append((CLICK, *viewport.to_logical(event.pos)))
+            elif event.type == pygame.VIDEORESIZE:
+                viewport.resize(pygame.display.get_surface())
+                game.dirty.mark_all()
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                # A janela foi coberta e redesenhada pelo sistema: apresenta tudo de novo
+                viewport.shown = None
+                game.dirty.mark_all()
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    profiler.toggle_overlay()
+                    game.dirty.mark_all()
+                elif event.key == pygame.K_F4 and profiler.enabled:
+                    profiler.export(PROFILE_TRACE_FILE)
+
+        keys = pygame.key.get_pressed()
+        scroll_dir = keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]
+
+        behind = False
+        with profiler.section("update"):
+            if frames is not None:
+                # Replay: aplica os frames gravados conforme o relógio avança
+                while next_frame is not None and next_frame[0] * SIM_DT <= accumulator:
+                    accumulator -= next_frame[0] * SIM_DT
+                    run_frame(game, *next_frame)
+                    next_frame = next(frames, None)
+                if next_frame is None:
+                    print(f"Fim do replay: {game.state}, nível {game.level}, pontos {int(game.points)}")
+                    break
+            else:
+                # Passos fixos até alcançar o relógio, no máximo MAX_SUBSTEPS por frame
+                steps = min(int(accumulator / SIM_DT), MAX_SUBSTEPS)
+                accumulator -= steps * SIM_DT
+                behind = accumulator >= SIM_DT
+                if behind and skipped >= MAX_FRAME_SKIP:
+                    # Máquina sobrecarregada: descarta o atraso (o jogo fica mais
+                    # lento) em vez de acumular frames e atrasar a resposta aos cliques
+                    accumulator %= SIM_DT
+                    behind = False
+                if recorder is not None:
+                    recorder.frame(steps, scroll_dir, inputs)
+                run_frame(game, steps, scroll_dir, inputs)
+
+        # Atrasado: pula o desenho (no máximo MAX_FRAME_SKIP vezes seguidas)
+        if behind and not first_frame:
+            skipped += 1
+            profiler.end_frame()
+            continue
+        skipped = 0
+        game.render_alpha = min(1.0, accumulator / SIM_DT)
+
+        if dirty_rects:
+            rects = game.draw_dirty(back_buffer)
+            if profiler.overlay:
+                # O overlay é translúcido: a cena embaixo dele é refeita no
+                # próximo frame, senão o fundo escurece e os números se acumulam
+                overlay_rect = profiler.draw_overlay(back_buffer)
+                rects.append(overlay_rect)
+                game.dirty.mark(overlay_rect)
+            with profiler.section("present"):
+                viewport.present(back_buffer, rects)
+        else:
+            game.draw(viewport.canvas)
+            if profiler.overlay:
+                profiler.draw_overlay(viewport.canvas)
+            layer = game.static_layer()
+            with profiler.section("present"):
+                if layer and viewport.scaled and not profiler.overlay:
+                    viewport.present_layer(game.layers.scaled(layer, viewport.area.size))
+                else:
+                    viewport.present(viewport.canvas)
 
-        game.update(dt)
-        game.draw(screen)
+        profiler.end_frame()
 
-        pygame.display.flip()
+        if first_frame:
+            first_frame = False
+            print(f"Primeiro frame em {(time.perf_counter() - STARTUP_TIME) * 1000:.0f} ms "
+                  f"(sons: {assets.load_summary()})")
 
+    if recorder is not None:
+        recorder.close()
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Cidade Solar Inteligente")
+    parser.add_argument("--record", metavar="ARQUIVO", help="Grava a sessão (seed, frames e cliques) para replay")
+    parser.add_argument("--replay", metavar="ARQUIVO", help="Reproduz uma sessão gravada em tempo real")
+    parser.add_argument("--window", metavar="LxA", help="Tamanho da janela, ex: 1280x720 (a tela é escalada)")
+    parser.add_argument("--fullscreen", action="store_true", help="Tela cheia na resolução do monitor")
+    parser.add_argument("--dirty-rects", action="store_true", default=DIRTY_RECT_MODE,
+                        help="Redesenha e apresenta só as áreas que mudaram")
+    args = parser.parse_args()
+    window_size = tuple(int(n) for n in args.window.lower().split("x")) if args.window else None
+    main(args.record, args.replay, window_size, args.fullscreen, args.dirty_rects)
@@ -0,0 +1,53 @@
+import pygame
+
+# --- RITMO DE FRAMES ADAPTATIVO ---
+# Cada tela diz de quanto movimento precisa (Game.pace):
+#   ACTIVE  - partida em andamento: sempre a FPS cheio
+#   AMBIENT - só enfeites se mexem (nuvens, confetes): FPS cheio, mas cai
+#             para IDLE_FPS depois de IDLE_AFTER segundos sem entrada
+#   STATIC  - nada se mexe (tutorial, fim de jogo): o laço dorme em
+#             pygame.event.wait até chegar um evento ou passar IDLE_WAIT
+# Qualquer mouse ou tecla volta ao ritmo cheio no mesmo frame.
+
+ACTIVE = "active"
+AMBIENT = "ambient"
+STATIC = "static"
+
+IDLE_FPS = 20      # Telas animadas sem ninguém mexendo
+IDLE_AFTER = 10.0  # Segundos sem entrada até reduzir o ritmo
+IDLE_WAIT = 1000   # ms que uma tela parada dorme esperando eventos
+
+INPUT_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                pygame.MOUSEWHEEL, pygame.KEYDOWN, pygame.KEYUP)
+
+
+class FramePacer:
+    def __init__(self, clock, fps, idle_fps=IDLE_FPS, idle_after=IDLE_AFTER, idle_wait=IDLE_WAIT):
+        self.clock = clock
+        self.fps = fps
+        self.idle_fps = idle_fps
+        self.idle_after = idle_after
+        self.idle_wait = idle_wait
+        self.last_input = pygame.time.get_ticks()
+
+    def idle(self):
+        return pygame.time.get_ticks() - self.last_input >= self.idle_after * 1000
+
+    def tick(self, pace):
+        # Espera o próximo frame; devolve (segundos passados, eventos do frame)
+        if pace == STATIC:
+            event = pygame.event.wait(self.idle_wait)
+            self.clock.tick(self.fps)  # Rajada de eventos: no máximo FPS frames
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events += pygame.event.get()
+            # Nada anda numa tela parada: o tempo dormindo não vira atraso
+            # para a simulação alcançar
+            elapsed = 1.0 / self.fps if self.fps else 0.0
+        else:
+            fps = self.idle_fps if pace == AMBIENT and self.idle() else self.fps
+            elapsed = self.clock.tick(fps) / 1000.0
+            events = pygame.event.get()
+
+        if any(event.type in INPUT_EVENTS for event in events):
+            self.last_input = pygame.time.get_ticks()
+        return elapsed, events
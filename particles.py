@@ -0,0 +1,180 @@
+import random
+
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Níveis de transparência pré-renderizados (quanto mais, mais suave o fade)
+ALPHA_BUCKETS = 16
+GRAVITY = 0.2
+MAX_SIZE = 8
+
+# --- SPRITES DE PARTÍCULA ---
+# Um círculo por (cor, tamanho, faixa de alpha), criado uma única vez.
+_sprites = {}
+
+
+def get_particle_sprite(color, size, bucket):
+    key = (color, size, bucket)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        alpha = int(255 * bucket / (ALPHA_BUCKETS - 1))
+        sprite = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, alpha), (size, size), size)
+        _sprites[key] = sprite
+    return sprite
+
+
+class ParticlePool:
+    # Todas as partículas vivem em arrays de tamanho fixo.
+    # Vagas mortas (life <= 0) são reaproveitadas sem alocar nada novo.
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.rng = numpy.random.default_rng()
+        self.x = numpy.zeros(capacity, dtype=numpy.float32)
+        self.y = numpy.zeros(capacity, dtype=numpy.float32)
+        self.prev_x = numpy.zeros(capacity, dtype=numpy.float32)  # Posição no passo anterior
+        self.prev_y = numpy.zeros(capacity, dtype=numpy.float32)
+        self.vx = numpy.zeros(capacity, dtype=numpy.float32)
+        self.vy = numpy.zeros(capacity, dtype=numpy.float32)
+        self.life = numpy.zeros(capacity, dtype=numpy.float32)
+        self.size = numpy.zeros(capacity, dtype=numpy.int16)
+        self.color = numpy.zeros((capacity, 3), dtype=numpy.uint8)
+
+    def __len__(self):
+        return int(numpy.count_nonzero(self.life > 0))
+
+    def seed(self, seed):
+        self.rng = numpy.random.default_rng(seed)
+
+    def clear(self):
+        self.life[:] = 0
+
+    def emit(self, x, y, color, count):
+        free = numpy.flatnonzero(self.life <= 0)[:count]
+        n = len(free)
+        if n == 0:
+            return
+        self.x[free] = self.prev_x[free] = x
+        self.y[free] = self.prev_y[free] = y
+        self.vx[free] = self.rng.uniform(-2, 2, n)
+        self.vy[free] = self.rng.uniform(-4, -1, n)
+        self.size[free] = self.rng.integers(3, MAX_SIZE + 1, n)
+        self.color[free] = color
+        self.life[free] = 1.0
+
+    def update(self, dt):
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
+        alive = self.life > 0
+        self.x[alive] += self.vx[alive]
+        self.y[alive] += self.vy[alive]
+        self.vy[alive] += GRAVITY
+        self.life[alive] -= dt * 2
+
+    def bounds(self):
+        # Retângulo que cobre todas as partículas vivas (ou None)
+        # (inclui a posição anterior: o desenho pode estar interpolado entre as duas)
+        alive = self.life > 0
+        if not alive.any():
+            return None
+        x = numpy.concatenate((self.x[alive], self.prev_x[alive]))
+        y = numpy.concatenate((self.y[alive], self.prev_y[alive]))
+        return pygame.Rect(int(x.min()) - MAX_SIZE - 1, int(y.min()) - MAX_SIZE - 1,
+                           int(x.max() - x.min()) + MAX_SIZE*2 + 3, int(y.max() - y.min()) + MAX_SIZE*2 + 3)
+
+    def draw(self, surface, view=None, alpha=1.0):
+        # view: retângulo visível em coordenadas do mundo (câmera); o que está fora não é desenhado
+        # alpha: interpolação entre a posição anterior (0) e a atual (1)
+        alive = self.life > 0
+        if alpha == 1.0:
+            x, y = self.x, self.y
+        else:
+            x = self.prev_x + (self.x - self.prev_x) * alpha
+            y = self.prev_y + (self.y - self.prev_y) * alpha
+        ox = oy = 0
+        if view is not None:
+            ox, oy = view.x, view.y
+            alive &= (x > view.left - MAX_SIZE) & (x < view.right + MAX_SIZE)
+            alive &= (y > view.top - MAX_SIZE) & (y < view.bottom + MAX_SIZE)
+        alive = numpy.flatnonzero(alive)
+        if len(alive) == 0:
+            return
+        life = self.life[alive]
+        sizes = (self.size[alive] * life).astype(numpy.int32)
+        buckets = (life * (ALPHA_BUCKETS - 1)).astype(numpy.int32)
+        xs = (x[alive] - sizes).astype(numpy.int32) - ox
+        ys = (y[alive] - sizes).astype(numpy.int32) - oy
+        colors = self.color[alive].tolist()
+
+        batch = []
+        for size, bucket, x, y, color in zip(sizes.tolist(), buckets.tolist(), xs.tolist(), ys.tolist(), colors):
+            if size <= 0:
+                continue
+            batch.append((get_particle_sprite(tuple(color), size, bucket), (x, y)))
+        surface.blits(batch, doreturn=False)
+
+
+class _ListParticlePool:
+    # Versão sem NumPy: mesma interface, listas de partículas
+    # [x, y, vx, vy, life, size, color, prev_x, prev_y].
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.rng = random.Random()
+        self.particles = []
+
+    def __len__(self):
+        return len(self.particles)
+
+    def seed(self, seed):
+        self.rng = random.Random(seed)
+
+    def clear(self):
+        self.particles.clear()
+
+    def emit(self, x, y, color, count):
+        count = min(count, self.capacity - len(self.particles))
+        for _ in range(count):
+            self.particles.append([x, y, self.rng.uniform(-2, 2), self.rng.uniform(-4, -1), 1.0,
+                                   self.rng.randint(3, MAX_SIZE), tuple(color), x, y])
+
+    def update(self, dt):
+        for p in self.particles:
+            p[7] = p[0]
+            p[8] = p[1]
+            p[0] += p[2]
+            p[1] += p[3]
+            p[3] += GRAVITY
+            p[4] -= dt * 2
+        self.particles[:] = [p for p in self.particles if p[4] > 0]
+
+    def bounds(self):
+        if not self.particles:
+            return None
+        xs = [p[0] for p in self.particles] + [p[7] for p in self.particles]
+        ys = [p[1] for p in self.particles] + [p[8] for p in self.particles]
+        return pygame.Rect(int(min(xs)) - MAX_SIZE - 1, int(min(ys)) - MAX_SIZE - 1,
+                           int(max(xs) - min(xs)) + MAX_SIZE*2 + 3, int(max(ys) - min(ys)) + MAX_SIZE*2 + 3)
+
+    def draw(self, surface, view=None, alpha=1.0):
+        ox = oy = 0
+        if view is not None:
+            ox, oy = view.x, view.y
+            area = view.inflate(MAX_SIZE * 2, MAX_SIZE * 2)
+        batch = []
+        for x, y, _, _, life, size, color, prev_x, prev_y in self.particles:
+            x = prev_x + (x - prev_x) * alpha
+            y = prev_y + (y - prev_y) * alpha
+            size = int(size * life)
+            if size <= 0 or (view is not None and not area.collidepoint(x, y)):
+                continue
+            bucket = int(life * (ALPHA_BUCKETS - 1))
+            batch.append((get_particle_sprite(color, size, bucket), (int(x - size) - ox, int(y - size) - oy)))
+        surface.blits(batch, doreturn=False)
+
+
+if numpy is None:
+    ParticlePool = _ListParticlePool
@@ -0,0 +1,181 @@
+import csv
+import json
+import time
+from collections import deque
+
+import pygame
+
+from render_cache import get_font
+
+# --- PROFILER DE FRAMES ---
+# Mede o tempo de cada parte do frame (update, céu, nuvens, prédios...),
+# conta chamadas de pygame.draw e Surfaces criadas, e mostra tudo num
+# overlay (F3). Desligado, cada section() custa só uma checagem de flag.
+
+DRAW_FUNCS = ("rect", "line", "lines", "aaline", "aalines", "circle", "ellipse", "arc", "polygon")
+OVERLAY_POS = (840, 20)
+
+
+class _NullSection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    __slots__ = ("times", "name", "start")
+
+    def __init__(self, times, name):
+        self.times = times
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = (time.perf_counter() - self.start) * 1000
+        self.times[self.name] = self.times.get(self.name, 0.0) + elapsed
+        return False
+
+
+class Profiler:
+    def __init__(self, history=300, trace_size=3600):
+        self.enabled = False
+        self.overlay = False
+        self.frame_times = deque(maxlen=history)  # ms, para os percentis
+        self.trace = deque(maxlen=trace_size)     # um registro por frame, para exportar
+        self.times = {}
+        self.counters = {"draw_calls": 0, "surfaces": 0}
+        self.frame_start = 0.0
+        self.frame_index = 0
+        self.originals = None
+        self.overlay_bg = None
+
+    # --- LIGA/DESLIGA ---
+    def enable(self):
+        if not self.enabled:
+            self.enabled = True
+            self.install_hooks()
+
+    def disable(self):
+        if self.enabled:
+            self.enabled = False
+            self.remove_hooks()
+
+    def toggle_overlay(self):
+        self.overlay = not self.overlay
+        if self.overlay:
+            self.enable()
+        else:
+            self.disable()
+
+    def install_hooks(self):
+        # Conta chamadas de pygame.draw e criações de Surface enquanto ligado
+        counters = self.counters
+        self.originals = {name: getattr(pygame.draw, name) for name in DRAW_FUNCS}
+
+        def counting(func):
+            def wrapper(*args, **kwargs):
+                counters["draw_calls"] += 1
+                return func(*args, **kwargs)
+            return wrapper
+
+        for name, func in self.originals.items():
+            setattr(pygame.draw, name, counting(func))
+
+        original_surface = pygame.Surface
+
+        class CountingSurface(original_surface):
+            def __init__(self, *args, **kwargs):
+                counters["surfaces"] += 1
+                super().__init__(*args, **kwargs)
+
+        self.originals["Surface"] = original_surface
+        pygame.Surface = CountingSurface
+
+    def remove_hooks(self):
+        pygame.Surface = self.originals.pop("Surface")
+        for name, func in self.originals.items():
+            setattr(pygame.draw, name, func)
+        self.originals = None
+
+    # --- MEDIÇÃO ---
+    def section(self, name):
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self.times, name)
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.times = {}
+        self.counters["draw_calls"] = 0
+        self.counters["surfaces"] = 0
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        total = (time.perf_counter() - self.frame_start) * 1000
+        self.frame_times.append(total)
+        self.trace.append({
+            "frame": self.frame_index,
+            "total_ms": round(total, 3),
+            "sections": {name: round(ms, 3) for name, ms in self.times.items()},
+            **self.counters,
+        })
+        self.frame_index += 1
+
+    def percentiles(self):
+        if not self.frame_times:
+            return 0.0, 0.0, 0.0
+        values = sorted(self.frame_times)
+        last = len(values) - 1
+        return tuple(values[min(last, int(p * len(values)))] for p in (0.50, 0.95, 0.99))
+
+    # --- OVERLAY ---
+    def draw_overlay(self, surface):
+        p50, p95, p99 = self.percentiles()
+        lines = [
+            f"frame p50 {p50:.1f}  p95 {p95:.1f}  p99 {p99:.1f} ms",
+            f"draw calls {self.counters['draw_calls']}  surfaces {self.counters['surfaces']}",
+        ]
+        for name, ms in sorted(self.times.items(), key=lambda item: -item[1]):
+            lines.append(f"{name:<10} {ms:6.2f} ms")
+
+        font = get_font(22)
+        height = 10 + 20 * len(lines)
+        if self.overlay_bg is None or self.overlay_bg.get_height() != height:
+            self.overlay_bg = pygame.Surface((340, height), pygame.SRCALPHA)
+            self.overlay_bg.fill((0, 0, 0, 170))
+
+        x, y = OVERLAY_POS
+        surface.blit(self.overlay_bg, (x, y))
+        for i, line in enumerate(lines):
+            surface.blit(font.render(line, True, (255, 255, 255)), (x + 10, y + 6 + i * 20))
+        return pygame.Rect(x, y, *self.overlay_bg.get_size())
+
+    # --- EXPORTAÇÃO ---
+    def export(self, path):
+        # .csv: uma coluna por seção; qualquer outra extensão: JSON
+        frames = list(self.trace)
+        if path.endswith(".csv"):
+            names = sorted({name for frame in frames for name in frame["sections"]})
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["frame", "total_ms", "draw_calls", "surfaces", *names])
+                for frame in frames:
+                    writer.writerow([frame["frame"], frame["total_ms"], frame["draw_calls"], frame["surfaces"],
+                                     *(frame["sections"].get(name, 0.0) for name in names)])
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"frames": frames}, f)
+
+
+profiler = Profiler()
@@ -0,0 +1,132 @@
+import random
+
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+STREAK_LENGTH = 15
+
+_streaks = {}
+
+
+def get_streak(color):
+    # Gota pré-renderizada (linha de 2px), desenhada com blit
+    streak = _streaks.get(color)
+    if streak is None:
+        streak = pygame.Surface((2, STREAK_LENGTH + 1))
+        streak.fill(color)
+        _streaks[color] = streak
+    return streak
+
+
+class RainSystem:
+    # Buffer circular de gotas: a gota mais antiga é sobrescrita quando
+    # o limite (max_drops) é atingido, então a chuva nunca aloca memória nova.
+    def __init__(self, width, height, color, spawn_rate=48, max_drops=600):
+        self.width = width
+        self.height = height
+        self.color = color
+        self.spawn_rate = spawn_rate  # Gotas por segundo
+        self.max_drops = max_drops
+        self.rng = numpy.random.default_rng()
+        self.x = numpy.zeros(max_drops, dtype=numpy.float32)
+        self.y = numpy.zeros(max_drops, dtype=numpy.float32)
+        self.speed = numpy.zeros(max_drops, dtype=numpy.float32)
+        self.alive = numpy.zeros(max_drops, dtype=bool)
+        self.head = 0
+        self.spawn_acc = 0.0
+
+    def __len__(self):
+        return int(numpy.count_nonzero(self.alive))
+
+    def seed(self, seed):
+        self.rng = numpy.random.default_rng(seed)
+
+    def clear(self):
+        self.alive[:] = False
+        self.spawn_acc = 0.0
+
+    def spawn(self, count):
+        count = min(count, self.max_drops)
+        idx = (self.head + numpy.arange(count)) % self.max_drops
+        self.x[idx] = self.rng.integers(0, self.width + 1, count)
+        self.y[idx] = -10
+        self.speed[idx] = self.rng.uniform(400, 700, count)
+        self.alive[idx] = True
+        self.head = (self.head + count) % self.max_drops
+
+    def update(self, dt):
+        self.spawn_acc += self.spawn_rate * dt
+        count = int(self.spawn_acc)
+        if count:
+            self.spawn_acc -= count
+            self.spawn(count)
+
+        self.y += self.speed * dt
+        self.alive &= self.y < self.height
+
+    def draw(self, surface):
+        idx = numpy.flatnonzero(self.alive)
+        if len(idx) == 0:
+            return
+        streak = get_streak(self.color)
+        xs = (self.x[idx] - 1).astype(numpy.int32).tolist()
+        ys = self.y[idx].astype(numpy.int32).tolist()
+        surface.blits([(streak, pos) for pos in zip(xs, ys)], doreturn=False)
+
+
+class _ListRainSystem:
+    # Versão sem NumPy: mesma interface, com listas pré-alocadas.
+    def __init__(self, width, height, color, spawn_rate=48, max_drops=600):
+        self.width = width
+        self.height = height
+        self.color = color
+        self.spawn_rate = spawn_rate
+        self.max_drops = max_drops
+        self.rng = random.Random()
+        self.drops = [[0, 0.0, 0.0, False] for _ in range(max_drops)]
+        self.head = 0
+        self.spawn_acc = 0.0
+
+    def __len__(self):
+        return sum(1 for d in self.drops if d[3])
+
+    def seed(self, seed):
+        self.rng = random.Random(seed)
+
+    def clear(self):
+        for drop in self.drops:
+            drop[3] = False
+        self.spawn_acc = 0.0
+
+    def spawn(self, count):
+        for _ in range(min(count, self.max_drops)):
+            drop = self.drops[self.head]
+            drop[0] = self.rng.randint(0, self.width)
+            drop[1] = -10
+            drop[2] = self.rng.uniform(400, 700)
+            drop[3] = True
+            self.head = (self.head + 1) % self.max_drops
+
+    def update(self, dt):
+        self.spawn_acc += self.spawn_rate * dt
+        count = int(self.spawn_acc)
+        if count:
+            self.spawn_acc -= count
+            self.spawn(count)
+
+        for drop in self.drops:
+            if drop[3]:
+                drop[1] += drop[2] * dt
+                drop[3] = drop[1] < self.height
+
+    def draw(self, surface):
+        streak = get_streak(self.color)
+        surface.blits([(streak, (int(d[0]) - 1, int(d[1]))) for d in self.drops if d[3]], doreturn=False)
+
+
+if numpy is None:
+    RainSystem = _ListRainSystem
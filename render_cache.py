@@ -0,0 +1,156 @@
+from collections import OrderedDict
+
+import pygame
+
+try:
+    import numpy
+    import pygame.surfarray
+except ImportError:
+    numpy = None
+
+# --- CACHE DE GRADIENTES ---
+# Cada fundo é gerado uma única vez e depois desenhado com um único blit.
+# Chave: (tamanho, cor inicial, cor final, intensidade). O tamanho é o da
+# tela lógica, então mudar o tamanho da janela não invalida nada.
+_gradients = {}
+
+
+def clear_gradients():
+    _gradients.clear()
+
+
+def _build_gradient(size, start, end, falloff):
+    width, height = size
+    surf = pygame.Surface(size)
+
+    if numpy is not None:
+        factor = numpy.arange(height, dtype=numpy.float64) / height * falloff
+        start_arr = numpy.array(start[:3], dtype=numpy.float64)
+        end_arr = numpy.array(end[:3], dtype=numpy.float64)
+        rows = (start_arr + (end_arr - start_arr) * factor[:, None]).astype(numpy.uint8)
+        pygame.surfarray.blit_array(surf, numpy.broadcast_to(rows, (width, height, 3)).copy())
+    else:
+        for y in range(height):
+            factor = y / height * falloff
+            color = tuple(int(start[i] + (end[i] - start[i]) * factor) for i in range(3))
+            pygame.draw.line(surf, color, (0, y), (width, y))
+
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert()
+    return surf
+
+
+def get_gradient(size, start, end=(0, 0, 0), falloff=1.0):
+    # Cor de cada linha: start + (end - start) * (y / altura) * falloff
+    key = (tuple(size), tuple(start), tuple(end), falloff)
+    surf = _gradients.get(key)
+    if surf is None:
+        surf = _build_gradient(key[0], start, end, falloff)
+        _gradients[key] = surf
+    return surf
+
+
+# --- FONTES E TEXTOS ---
+# Cada tamanho de fonte é carregado uma única vez.
+_fonts = {}
+
+
+def get_font(size):
+    font = _fonts.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _fonts[size] = font
+    return font
+
+
+# Cache LRU de textos renderizados, limitado por memória (em bytes).
+TEXT_CACHE_BUDGET = 8 * 1024 * 1024
+_texts = OrderedDict()
+_texts_bytes = 0
+
+
+def _surface_bytes(surf):
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+def render_text(text, size, color, antialias=True):
+    global _texts_bytes
+    key = (text, size, tuple(color), antialias)
+    surf = _texts.get(key)
+    if surf is not None:
+        _texts.move_to_end(key)
+        return surf
+
+    surf = get_font(size).render(text, antialias, color)
+    _texts[key] = surf
+    _texts_bytes += _surface_bytes(surf)
+
+    # Remove os textos menos usados até caber no orçamento
+    while _texts_bytes > TEXT_CACHE_BUDGET and len(_texts) > 1:
+        _, old = _texts.popitem(last=False)
+        _texts_bytes -= _surface_bytes(old)
+    return surf
+
+
+def clear_texts():
+    global _texts_bytes
+    _texts.clear()
+    _texts_bytes = 0
+
+
+class TextLabel:
+    # Texto que muda durante a partida (ex: "Pontos: 120").
+    # Só renderiza de novo quando o texto exibido muda, sem encher o cache LRU.
+    def __init__(self, size, color, antialias=True):
+        self.size = size
+        self.color = color
+        self.antialias = antialias
+        self.text = None
+        self.surface = None
+
+    def render(self, text):
+        if text != self.text:
+            self.text = text
+            self.surface = get_font(self.size).render(text, self.antialias, self.color)
+        return self.surface
+
+
+# --- CAMADAS RETIDAS ---
+# Telas que quase não mudam (menu, tutorial, fim de jogo) são compostas uma
+# vez numa Surface e reaproveitadas enquanto a chave (os valores exibidos)
+# for a mesma. Cada nome guarda só a versão mais recente.
+class LayerCache:
+    def __init__(self, size):
+        self.size = size
+        self.layers = {}  # nome -> (chave, surface, área com conteúdo, {tamanho: escalada})
+
+    def get(self, name, key, build, alpha=False):
+        # build(surface) desenha a camada; alpha=True para sobrepor a partes animadas
+        entry = self.layers.get(name)
+        if entry is not None and entry[0] == key:
+            return entry[1], entry[2]
+
+        surf = pygame.Surface(self.size, pygame.SRCALPHA if alpha else 0)
+        build(surf)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha() if alpha else surf.convert()
+        area = surf.get_bounding_rect() if alpha else surf.get_rect()
+        self.layers[name] = (key, surf, area, {})
+        return surf, area
+
+    def blit(self, surface, name, key, build, alpha=False):
+        surf, area = self.get(name, key, build, alpha)
+        surface.blit(surf, area.topleft, area)
+
+    def scaled(self, name, size):
+        # A camada no tamanho de saída da janela (viewport.py): escalada com
+        # suavização uma vez e guardada até a camada ser refeita
+        scaled = self.layers[name][3]
+        surf = scaled.get(size)
+        if surf is None:
+            scaled.clear()  # Só o tamanho de saída atual interessa
+            surf = scaled[size] = pygame.transform.smoothscale(self.layers[name][1], size)
+        return surf
+
+    def clear(self):
+        self.layers.clear()
@@ -0,0 +1,160 @@
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+
+from simulation import SIM_DT
+
+# --- GRAVAÇÃO E REPLAY DE PARTIDAS ---
+# Com a mesma seed, os mesmos passos de simulação e os mesmos cliques, o
+# jogo chega sempre ao mesmo resultado. O log binário guarda só isso:
+#   cabeçalho: "CSRP", versão, seed, city_size
+#   por frame: passos de simulação (SIM_DT), direção da câmera, nº de eventos
+#   por evento: tipo (clique ou roda do mouse), x/deslocamento, y
+#
+#   python main.py --record sessao.rpl        # joga gravando
+#   python main.py --replay sessao.rpl        # assiste em tempo real
+#   python replay.py sessao.rpl               # roda sem tela, o mais rápido possível
+#   python replay.py logs/*.rpl --save r.json # guarda os resultados
+#   python replay.py logs/*.rpl --check r.json
+
+MAGIC = b"CSRP"
+VERSION = 2
+HEADER = struct.Struct("<4sBQI")  # magic, versão, seed, city_size
+FRAME = struct.Struct("<HbB")     # passos de simulação, direção da câmera, nº de eventos
+EVENT = struct.Struct("<Bhh")     # tipo, x (ou deslocamento da roda), y
+
+MAX_EVENTS = 255  # Eventos por frame gravado (contador de 1 byte)
+
+CLICK = 1
+WHEEL = 2
+
+
+def apply_inputs(game, inputs):
+    # Mesmo caminho para a partida ao vivo e para o replay
+    for kind, a, b in inputs:
+        if kind == CLICK:
+            game.handle_click((a, b))
+        elif kind == WHEEL:
+            game.scroll(a)
+
+
+def run_frame(game, steps, scroll_dir, inputs):
+    # Um frame do laço principal: entradas, depois `steps` passos fixos
+    apply_inputs(game, inputs)
+    game.scroll_dir = scroll_dir
+    for _ in range(steps):
+        game.update(SIM_DT)
+
+
+class Recorder:
+    def __init__(self, path, seed, city_size=0):
+        # Sem buffer: se o jogo travar, o log tem tudo até o último frame
+        self.file = open(path, "wb", buffering=0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, city_size))
+
+    def frame(self, steps, scroll_dir, inputs):
+        # Mais eventos do que cabem num frame: os primeiros vão em frames
+        # sem passos de simulação (as entradas são aplicadas antes dos passos,
+        # então o replay chega ao mesmo estado)
+        data = b""
+        while len(inputs) > MAX_EVENTS:
+            data += self._pack(0, scroll_dir, inputs[:MAX_EVENTS])
+            inputs = inputs[MAX_EVENTS:]
+        self.file.write(data + self._pack(steps, scroll_dir, inputs))
+
+    @staticmethod
+    def _pack(steps, scroll_dir, inputs):
+        return FRAME.pack(steps, scroll_dir, len(inputs)) + b"".join(EVENT.pack(*event) for event in inputs)
+
+    def close(self):
+        self.file.close()
+
+
+class Replay:
+    def __init__(self, seed, city_size, frames):
+        self.seed = seed
+        self.city_size = city_size
+        self.frames = frames  # [(passos, direção da câmera, [eventos])]
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, seed, city_size = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: não é um replay (versão {VERSION})")
+
+        frames = []
+        offset = HEADER.size
+        while offset < len(data):
+            steps, scroll_dir, count = FRAME.unpack_from(data, offset)
+            offset += FRAME.size
+            events = [EVENT.unpack_from(data, offset + i * EVENT.size) for i in range(count)]
+            offset += count * EVENT.size
+            frames.append((steps, scroll_dir, events))
+        return cls(seed, city_size, frames)
+
+
+def result(game):
+    return {
+        "state": game.state,
+        "level": game.level,
+        "time": round(game.time, 6),
+        "points": round(game.points, 6),
+        "energy": round(game.energy_total, 6),
+        "panels": game.panels_installed,
+    }
+
+
+def run_headless(replay):
+    # Só a lógica e os efeitos: nada é desenhado e o relógio não é esperado
+    from assets import AssetManager
+    from main import Game
+
+    game = Game(AssetManager(enabled=False), replay.city_size, replay.seed)
+    for steps, scroll_dir, inputs in replay.frames:
+        run_frame(game, steps, scroll_dir, inputs)
+    return result(game)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Roda replays sem tela e compara os resultados")
+    parser.add_argument("replays", nargs="+", help="Arquivos .rpl gravados com main.py --record")
+    parser.add_argument("--save", metavar="ARQUIVO", help="Grava os resultados em JSON")
+    parser.add_argument("--check", metavar="ARQUIVO", help="Compara com resultados gravados antes")
+    args = parser.parse_args()
+
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+    results = {}
+    for path in args.replays:
+        replay = Replay.load(path)
+        start = time.perf_counter()
+        results[path] = run_headless(replay)
+        elapsed = time.perf_counter() - start
+        r = results[path]
+        print(f"{path}: {r['state']} nível {r['level']}, pontos {r['points']:.1f}, energia {r['energy']:.1f} "
+              f"({len(replay.frames)} frames em {elapsed * 1000:.0f} ms)")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Resultados salvos em {args.save}")
+
+    if args.check:
+        with open(args.check, encoding="utf-8") as f:
+            expected = json.load(f)
+        failed = [path for path in results if path in expected and results[path] != expected[path]]
+        for path in failed:
+            print(f"DIFERENTE: {path}\n  esperado {expected[path]}\n  obtido   {results[path]}")
+        if failed:
+            return 1
+        print("Todos os replays batem com os resultados gravados")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
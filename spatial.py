@@ -0,0 +1,45 @@
+import pygame
+
+# --- ÍNDICE ESPACIAL (GRADE UNIFORME) ---
+# Cada prédio é registrado nas células da grade que o seu retângulo toca.
+# Saber o que está sob o mouse olha uma única célula em vez da lista toda.
+
+CELL_SIZE = 128
+
+
+class SpatialGrid:
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.items = []
+
+    def _cell_range(self, rect):
+        size = self.cell_size
+        return (range(rect.left // size, (rect.right - 1) // size + 1),
+                range(rect.top // size, (rect.bottom - 1) // size + 1))
+
+    def build(self, items):
+        # items: objetos com .rect; a ordem original é mantida nas consultas
+        self.cells = {}
+        self.items = list(items)
+        for index, item in enumerate(self.items):
+            columns, rows = self._cell_range(item.rect)
+            for cx in columns:
+                for cy in rows:
+                    self.cells.setdefault((cx, cy), []).append(index)
+
+    def at(self, pos):
+        # Itens cujo retângulo contém o ponto
+        x, y = pos
+        indices = self.cells.get((int(x) // self.cell_size, int(y) // self.cell_size), ())
+        return [self.items[i] for i in indices if self.items[i].rect.collidepoint(pos)]
+
+    def query(self, rect):
+        # Itens cujo retângulo cruza `rect`, na ordem original
+        rect = pygame.Rect(rect)
+        columns, rows = self._cell_range(rect)
+        found = set()
+        for cx in columns:
+            for cy in rows:
+                found.update(self.cells.get((cx, cy), ()))
+        return [self.items[i] for i in sorted(found) if self.items[i].rect.colliderect(rect)]
@@ -0,0 +1,89 @@
+import random
+
+import pygame
+
+# --- RAIOS E CLARÃO DA TEMPESTADE ---
+# Os raios são sorteados uma vez e guardados como sprites; cada descarga
+# só escolhe um deles e uma posição. O clarão é uma única Surface branca
+# reaproveitada, com a transparência ajustada por set_alpha.
+# O intervalo entre raios é sorteado em segundos de simulação, então a
+# frequência não depende de quantos frames são desenhados.
+
+BOLT_POOL = 6            # Raios diferentes pré-desenhados
+BOLT_SEGMENTS = 6
+BOLT_RATE = 1.2          # Raios por segundo, em média
+BOLT_VISIBLE = 0.75      # O raio aparece enquanto o clarão estiver acima disso
+FLASH_ALPHA = 180        # Transparência máxima do clarão
+FLASH_DECAY = 5          # Quanto o clarão apaga por segundo
+BOLT_MARGIN = 100        # Distância mínima das bordas da tela
+
+
+def _build_bolt(rng):
+    # Linha quebrada de cima para baixo, desenhada numa Surface própria
+    x, y = 0, 0
+    points = [(x, y)]
+    for _ in range(BOLT_SEGMENTS):
+        x += rng.randint(-40, 40)
+        y += rng.randint(50, 100)
+        points.append((x, y))
+
+    left = min(px for px, _ in points) - 3
+    right = max(px for px, _ in points) + 3
+    sprite = pygame.Surface((right - left, y + 3), pygame.SRCALPHA)
+    local = [(px - left, py) for px, py in points]
+    pygame.draw.lines(sprite, (255, 255, 255), False, local, 5)
+    pygame.draw.lines(sprite, (200, 200, 255), False, local, 2)
+    return sprite, -left  # sprite e x do início do raio dentro dele
+
+
+class StormEffects:
+    def __init__(self, width, height, rng=None):
+        self.width = width
+        self.height = height
+        self.rng = rng or random.Random()
+        self.bolts = None
+        self.flash_surface = None
+        self.clear()
+
+    def clear(self):
+        self.flash = 0.0
+        self.bolt = None   # (sprite, posição) do raio atual
+        self.next_strike = self.rng.expovariate(BOLT_RATE)
+
+    def build(self):
+        self.bolts = [_build_bolt(self.rng) for _ in range(BOLT_POOL)]
+        self.flash_surface = pygame.Surface((self.width, self.height))
+        self.flash_surface.fill((255, 255, 255))
+        if pygame.display.get_surface() is not None:
+            self.flash_surface = self.flash_surface.convert()
+
+    def update(self, dt, storm):
+        if self.flash > 0:
+            self.flash = max(0.0, self.flash - dt * FLASH_DECAY)
+        if not storm:
+            return
+
+        self.next_strike -= dt
+        if self.next_strike <= 0:
+            self.next_strike += self.rng.expovariate(BOLT_RATE)
+            self.strike()
+
+    def strike(self):
+        if self.bolts is None:
+            self.build()
+        sprite, start_x = self.rng.choice(self.bolts)
+        x = self.rng.randint(BOLT_MARGIN, self.width - BOLT_MARGIN)
+        self.bolt = (sprite, (x - start_x, 0))
+        self.flash = 1.0
+
+    def draw_bolt(self, surface):
+        if self.bolt is not None and self.flash > BOLT_VISIBLE:
+            surface.blit(*self.bolt)
+
+    def draw_flash(self, surface):
+        if self.flash <= 0:
+            return
+        if self.flash_surface is None:
+            self.build()
+        self.flash_surface.set_alpha(int(FLASH_ALPHA * self.flash))
+        surface.blit(self.flash_surface, (0, 0))
@@ -0,0 +1,72 @@
+import pygame
+
+from render_cache import render_text
+from spatial import SpatialGrid
+
+# --- BOTÕES DAS TELAS ---
+# Cada tela registra seus botões uma vez: retângulo, aparência e ação. O
+# desenho das telas e o clique passam pelo mesmo registro, então a área
+# que responde ao clique é sempre a que aparece na tela. A aparência é
+# desenhada uma vez numa Surface; o clique consulta uma grade (SpatialGrid)
+# montada no primeiro uso, sem criar retângulos novos.
+
+
+def plain_button(fill, border, label, size, text_dy, radius=15, width=4):
+    # Aparência padrão: fundo, borda e texto branco centralizado
+    def render(surface, rect):
+        pygame.draw.rect(surface, fill, rect, border_radius=radius)
+        pygame.draw.rect(surface, border, rect, width, border_radius=radius)
+        text = render_text(label, size, (255, 255, 255))
+        surface.blit(text, (rect.centerx - text.get_width() // 2, rect.y + text_dy))
+    return render
+
+
+class Button:
+    def __init__(self, rect, render, action, visible=None, margin=0):
+        # render(surface, rect): desenha o botão em `rect` (coordenadas da sprite)
+        # visible(): se o botão aparece agora (None = sempre)
+        # margin: espaço extra em volta do retângulo (sombra)
+        self.rect = pygame.Rect(rect)
+        self.render = render
+        self.action = action
+        self.visible = visible
+        self.margin = margin
+        self.sprite = None
+
+    def shown(self):
+        return self.visible is None or self.visible()
+
+    def draw(self, surface):
+        if self.sprite is None:
+            m = self.margin
+            self.sprite = pygame.Surface((self.rect.width + m * 2, self.rect.height + m * 2), pygame.SRCALPHA)
+            self.render(self.sprite, pygame.Rect(m, m, *self.rect.size))
+        surface.blit(self.sprite, (self.rect.x - self.margin, self.rect.y - self.margin))
+
+
+class UIRegistry:
+    def __init__(self):
+        self.buttons = {}  # tela -> [Button], na ordem de desenho
+        self.grids = {}    # tela -> SpatialGrid dos botões
+
+    def add(self, screen, button):
+        self.buttons.setdefault(screen, []).append(button)
+        self.grids.pop(screen, None)
+        return button
+
+    def draw(self, surface, screen):
+        for button in self.buttons.get(screen, ()):
+            if button.shown():
+                button.draw(surface)
+
+    def click(self, screen, pos):
+        # Executa a ação do botão visível sob `pos`; devolve se algum respondeu
+        grid = self.grids.get(screen)
+        if grid is None:
+            grid = self.grids[screen] = SpatialGrid()
+            grid.build(self.buttons.get(screen, ()))
+        for button in grid.at(pos):
+            if button.shown():
+                button.action()
+                return True
+        return False
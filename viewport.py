@@ -0,0 +1,109 @@
+import math
+
+import pygame
+
+# --- TELA LÓGICA ESCALADA PARA A JANELA ---
+# O jogo sempre desenha numa tela lógica de tamanho fixo (WIDTH x HEIGHT).
+# A Viewport escala essa tela para a janela real, mantendo a proporção
+# (faixas pretas nas sobras), e converte o mouse de volta para coordenadas
+# lógicas. Na janela do tamanho lógico não há escala: o jogo desenha direto
+# na janela, como antes.
+#   - frames com movimento: escala rápida (vizinho mais próximo), só das
+#     áreas que mudaram no modo de retângulos sujos
+#   - a escala é arredondada para baixo em passos de 1/SCALE_STEP: assim um
+#     bloco de `tile` pixels lógicos vira um número inteiro de pixels na
+#     janela e escalar só uma área dá o mesmo resultado que escalar tudo
+#   - telas paradas: a camada já escalada com suavização vem pronta do
+#     LayerCache (uma vez por tamanho de saída) e só é apresentada se mudou
+
+SCALE_STEP = 40
+
+
+class Viewport:
+    def __init__(self, logical_size):
+        self.logical = pygame.Rect((0, 0), logical_size)
+        self.window = None
+        self.canvas = None
+        self.output = None
+        self.area = self.logical.copy()
+        self.scale = 1.0
+        self.tile = 1
+        self.shown = None
+
+    @property
+    def scaled(self):
+        return self.area != self.logical
+
+    def resize(self, window):
+        # Chamado ao criar a janela e a cada mudança de tamanho
+        self.window = window
+        width, height = window.get_size()
+        steps = max(1, int(min(width / self.logical.width, height / self.logical.height) * SCALE_STEP))
+        self.scale = steps / SCALE_STEP
+        self.tile = SCALE_STEP // math.gcd(steps, SCALE_STEP)
+        self.area = pygame.Rect(0, 0, round(self.logical.width * self.scale), round(self.logical.height * self.scale))
+        self.area.center = (width // 2, height // 2)
+        self.shown = None
+
+        if self.scaled:
+            self.canvas = pygame.Surface(self.logical.size).convert()
+            self.output = window.subsurface(self.area)
+            window.fill((0, 0, 0))
+            pygame.display.flip()
+        else:
+            self.canvas = window
+            self.output = None
+
+    def to_logical(self, pos):
+        # Posição na janela -> posição na tela lógica (pode cair fora dela)
+        return (int((pos[0] - self.area.x) / self.scale), int((pos[1] - self.area.y) / self.scale))
+
+    def snap(self, rect):
+        # Alarga o retângulo lógico até a grade de blocos de `tile` pixels
+        tile = self.tile
+        left = rect.left // tile * tile
+        top = rect.top // tile * tile
+        right = -(-rect.right // tile) * tile
+        bottom = -(-rect.bottom // tile) * tile
+        return pygame.Rect(left, top, right - left, bottom - top).clip(self.logical)
+
+    def to_window(self, rect):
+        # Retângulo lógico alinhado aos blocos -> retângulo na janela (exato)
+        return pygame.Rect(round(rect.x * self.scale), round(rect.y * self.scale),
+                           round(rect.width * self.scale), round(rect.height * self.scale))
+
+    def present(self, source, rects=None):
+        # source: tela lógica desenhada; rects: áreas alteradas (None = tudo)
+        self.shown = None
+        if not self.scaled:
+            if rects is None:
+                pygame.display.flip()
+                return
+            if source is not self.window:
+                for rect in rects:
+                    self.window.blit(source, rect, rect)
+            pygame.display.update(rects)
+            return
+
+        if rects is None:
+            pygame.transform.scale(source, self.area.size, self.output)
+            pygame.display.update(self.area)
+            return
+
+        updated = []
+        for rect in rects:
+            rect = self.snap(rect)
+            if not rect:
+                continue
+            target = self.to_window(rect)
+            pygame.transform.scale(source.subsurface(rect), target.size, self.output.subsurface(target))
+            updated.append(target.move(self.area.topleft))
+        pygame.display.update(updated)
+
+    def present_layer(self, scaled):
+        # Tela parada inteira: `scaled` já está no tamanho de saída
+        if scaled is self.shown:
+            return
+        self.window.blit(scaled, self.area)
+        pygame.display.update(self.area)
+        self.shown = scaled